@@ -22,7 +22,8 @@ from .models.node import Node, NodeType
 from .models.edge import Edge
 
 # Core solver (can be used without UI)
-from .solver.transport_solver import TransportSolver, SolutionState, StepType
+from .solver.transport_solver import TransportSolver
+from .solver.utils import SolutionState, StepType
 from .solver.controller import SolverController
 
 # Utilities
@@ -12,6 +12,7 @@ class SolutionLogger:
         self.output_callback = output_callback
         self._current_step_buffer: List[str] = []
         self._step_history: dict[int, str] = {}  # step_number -> log text
+        self._deferred_steps: List[Tuple[SolutionState, int]] = []
     
     def _print(self, text: str = "") -> None:
         """Print to console and accumulate in buffer."""
@@ -90,9 +91,17 @@ class SolutionLogger:
         if log_text and self.output_callback:
             self.output_callback(log_text)
     
+    def log_step_deferred(self, state: SolutionState, step_number: int) -> None:
+        """Queue a step for later formatting (used by Solve-All batches)."""
+        self._deferred_steps.append((state, step_number))
+
+    def flush_deferred(self) -> None:
+        """Format all queued steps in one pass after the solve loop."""
+        deferred, self._deferred_steps = self._deferred_steps, []
+        for state, step_number in deferred:
+            self.log_step(state, step_number)
+
     def log_step(self, state: SolutionState, step_number: int) -> None:
-        from ..solver.transport_solver import StepType
-        
         # Clear buffer for new step
         self._current_step_buffer.clear()
         
@@ -1,5 +1,6 @@
 from .node import Node, NodeType
 from .edge import Edge, EPSILON
+from .csr import CSRGraph
 from .graph import Graph
 
-__all__ = ["Node", "NodeType", "Edge", "EPSILON", "Graph"]
+__all__ = ["Node", "NodeType", "Edge", "EPSILON", "CSRGraph", "Graph"]
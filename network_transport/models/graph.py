@@ -1,14 +1,26 @@
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
 from .node import Node, NodeType
 from .edge import Edge, EPSILON
+from .csr import CSRGraph
 
 
 class Graph:
     """Transport network graph managing nodes and edges."""
-    
+
     def __init__(self) -> None:
         self.nodes: Dict[str, Node] = {}
         self.edges: Dict[Tuple[str, str], Edge] = {}
+
+        # Edge partitions by capacity kind, so consumers that branch on
+        # finite vs infinite capacity can iterate branch-free instead
+        self.capacitated_edges: List[Edge] = []
+        self.uncapacitated_edges: List[Edge] = []
+
+        # Lazily built CSR view, invalidated on mutation
+        self._csr: Optional[CSRGraph] = None
     
     def add_node(
         self, 
@@ -20,6 +32,7 @@ class Graph:
         
         node = Node(node_id, balance)
         self.nodes[node_id] = node
+        self._csr = None
         return node
     
     def add_edge(
@@ -40,8 +53,101 @@ class Graph:
         
         edge = Edge(from_node, to_node, cost, capacity)
         self.edges[edge_id] = edge
+        self._partition_edge(edge)
+        self._csr = None
         return edge
+
+    def _partition_edge(self, edge: Edge) -> None:
+        """Record the edge in its capacity partition."""
+        if edge.capacity == float('inf'):
+            self.uncapacitated_edges.append(edge)
+        else:
+            self.capacitated_edges.append(edge)
     
+    def add_nodes_bulk(
+        self,
+        node_ids: Sequence[str],
+        balances: Sequence[float]
+    ) -> None:
+        """Add many nodes at once from parallel id/balance sequences."""
+        nodes = self.nodes
+        for node_id, balance in zip(node_ids, balances):
+            if node_id in nodes:
+                raise ValueError(f"Node with ID '{node_id}' already exists")
+            nodes[node_id] = Node(node_id, balance)
+        self._csr = None
+
+    def add_edges_bulk(
+        self,
+        from_nodes: Sequence[str],
+        to_nodes: Sequence[str],
+        costs: Sequence[float],
+        capacities: Optional[Sequence[float]] = None
+    ) -> None:
+        """Add many edges at once from parallel endpoint/cost/capacity sequences."""
+        if capacities is None:
+            capacities = [float('inf')] * len(costs)
+
+        nodes = self.nodes
+        edges = self.edges
+        for from_node, to_node, cost, capacity in zip(
+            from_nodes, to_nodes, costs, capacities
+        ):
+            if from_node not in nodes:
+                raise ValueError(f"Node '{from_node}' does not exist")
+            if to_node not in nodes:
+                raise ValueError(f"Node '{to_node}' does not exist")
+
+            edge_id = (from_node, to_node)
+            if edge_id in edges:
+                raise ValueError(f"Edge {from_node}->{to_node} already exists")
+
+            edge = Edge(from_node, to_node, cost, capacity)
+            edges[edge_id] = edge
+            self._partition_edge(edge)
+        self._csr = None
+
+    def csr(self) -> CSRGraph:
+        """
+        CSR view of the graph (cached; rebuilt after any mutation).
+
+        Node ids are mapped to dense indices and the edge arrays are sorted
+        by source node, so array-level consumers (reductions, kernels) avoid
+        per-edge dict lookups entirely.
+        """
+        if self._csr is None:
+            self._csr = CSRGraph.from_graph(self)
+        return self._csr
+
+    @classmethod
+    def from_csr(
+        cls,
+        indptr,
+        indices,
+        cost,
+        capacity,
+        balances,
+        labels: Sequence[str]
+    ) -> 'Graph':
+        """
+        Build a Graph from CSR-style arrays.
+
+        The inverse of csr(): node index i gets id labels[i], and edge k runs
+        from the node owning the indptr slice containing k to labels[indices[k]].
+        """
+        graph = cls()
+        graph.add_nodes_bulk(list(labels), [float(b) for b in balances])
+
+        out_degree = np.diff(indptr)
+        sources = np.repeat(np.arange(len(labels)), out_degree)
+        graph.add_edges_bulk(
+            [labels[i] for i in sources],
+            [labels[i] for i in indices],
+            [float(c) for c in cost],
+            [float(c) for c in capacity]
+        )
+        return graph
+
     def get_node(self, node_id: str) -> Optional[Node]:
         return self.nodes.get(node_id)
     
@@ -1,5 +1,6 @@
 from .solver_base import TransportSolverBase
-from .transport_solver import TransportSolver, SolutionState, StepType
+from .transport_solver import TransportSolver
+from .utils import SolutionState, StepType
 from .controller import SolverController
 
 __all__ = [
@@ -0,0 +1,45 @@
+"""
+Array kernels for the solver's per-iteration hot path.
+
+Operates on the CSR arrays from Graph.csr(). Pure NumPy by default; when
+numba is importable the kernels are JIT-compiled, same pattern as
+ui/_fastmath.py. numba is an optional accelerator, not a dependency.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    njit = None
+
+
+def reduced_costs(potentials, sources, targets, cost):
+    """
+    Reduced cost per edge: delta[k] = pi[target] - pi[source] - cost[k].
+
+    One gather-and-subtract pass over the edge arrays instead of a Python
+    loop with two dict lookups per edge.
+    """
+    return potentials[targets] - potentials[sources] - cost
+
+
+def violation_masks(deltas, flows, capacity, non_basis, eps):
+    """
+    Boolean masks of optimality violations among non-basis edges.
+
+    Returns (increase, decrease): empty edges whose reduced cost says flow
+    should grow, and saturated edges whose reduced cost says it should
+    shrink. The two are disjoint because they require opposite delta signs.
+
+    capacity may arrive narrowed to float32 (CSRGraph); widen it before
+    subtracting eps, since float32 arithmetic would swallow the 1e-9
+    tolerance entirely (35.0f32 - 1e-9 == 35.0f32).
+    """
+    increase = non_basis & (flows <= eps) & (deltas > eps)
+    decrease = non_basis & (flows >= capacity.astype(np.float64) - eps) & (deltas < -eps)
+    return increase, decrease
+
+
+if njit is not None:
+    reduced_costs = njit(cache=True)(reduced_costs)
+    violation_masks = njit(cache=True)(violation_masks)
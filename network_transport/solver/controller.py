@@ -2,7 +2,8 @@ from copy import deepcopy
 from typing import List, Optional
 from ..models.graph import Graph
 from .solver_base import TransportSolverBase
-from .transport_solver import TransportSolver, SolutionState, StepType
+from .transport_solver import TransportSolver
+from .utils import SolutionState, StepType
 
 
 class SolverController:
@@ -29,6 +30,15 @@ class SolverController:
         self.solver = solver or TransportSolver(graph)
         self.states: List[SolutionState] = []
         self.current_step: int = -1  # -1 = not started
+        # Set once when an OPTIMAL state enters the history; avoids
+        # re-inspecting the last state on every is_solved() query
+        self._solved: bool = False
+        # Monotonic navigation counter: bumped whenever the visible state
+        # changes, so callers can detect no-op transitions cheaply
+        self._version: int = 0
+        # Shared sentinel so repeated "not started" queries return the
+        # same object (stable identity for caches and is-checks)
+        self._initial_state = SolutionState(step_type=StepType.INITIAL_STATE)
     
     def is_started(self) -> bool:
         """Check if solution process has started."""
@@ -36,10 +46,7 @@ class SolverController:
     
     def is_solved(self) -> bool:
         """Check if optimal solution has been reached."""
-        if not self.states:
-            return False
-        last_state = self.states[-1]
-        return last_state.step_type == StepType.OPTIMAL
+        return self._solved
     
     def can_go_next(self) -> bool:
         """Check if we can execute or navigate to next step."""
@@ -61,7 +68,11 @@ class SolverController:
         """Get the current solution state."""
         if 0 <= self.current_step < len(self.states):
             return self.states[self.current_step]
-        return SolutionState(step_type=StepType.INITIAL_STATE)
+        return self._initial_state
+
+    def get_current_version(self) -> int:
+        """Get the navigation version (changes iff the visible state changed)."""
+        return self._version
     
     def get_step_count(self) -> int:
         """Get the total number of computed steps."""
@@ -79,16 +90,20 @@ class SolverController:
             if state:
                 self.states.append(state)
                 self.current_step = len(self.states) - 1
+                if state.step_type == StepType.OPTIMAL:
+                    self._solved = True
         else:
             # Just navigate forward
             self.current_step += 1
-    
+        self._version += 1
+
     def prev_step(self) -> None:
         """Navigate to previous step."""
         if not self.can_go_prev():
             return None
-        
+
         self.current_step -= 1
+        self._version += 1
     
     def solve_all(self) -> None:
         """ Execute all remaining steps until optimal solution or max iterations."""
@@ -102,7 +117,9 @@ class SolverController:
         """Reset the solver to initial state."""
         self.states.clear()
         self.current_step = -1
-        
+        self._solved = False
+        self._version += 1
+
         self.solver = deepcopy(self._initial_solver) or TransportSolver(self.graph)
     
     def _execute_next_step(self) -> None:
@@ -1,5 +1,7 @@
 from typing import Optional, Set, Tuple, List, Dict
 
+import numpy as np
+
 from network_transport.solver.utils import SolutionState, VamState
 
 from ...models.graph import Graph
@@ -10,17 +12,17 @@ from ..solver_factory import SolverFactory
 
 
 class DisjointSet:
-    """Union-Find data structure for cycle detection."""
-    
-    def __init__(self, elements: List[str]) -> None:
-        self.parent = {elem: elem for elem in elements}
-    
-    def find(self, x: str) -> str:
+    """Union-Find over dense node indices for cycle detection."""
+
+    def __init__(self, size: int) -> None:
+        self.parent = list(range(size))
+
+    def find(self, x: int) -> int:
         if self.parent[x] != x:
             self.parent[x] = self.find(self.parent[x])
         return self.parent[x]
-    
-    def union(self, x: str, y: str) -> bool:
+
+    def union(self, x: int, y: int) -> bool:
         root_x = self.find(x)
         root_y = self.find(y)
         
@@ -54,13 +56,16 @@ class BasisRebuilder:
         num_nodes = len(graph.nodes)
         required_size = num_nodes - 1
 
-        node_ids = list(graph.nodes.keys())
-        dsu = DisjointSet(node_ids)
+        # The id -> index mapping is built once in CSRGraph.from_graph and
+        # cached on the graph, so every rebuild shares it instead of
+        # re-enumerating the node dict
+        id_to_index = graph.csr().id_to_index
+        dsu = DisjointSet(num_nodes)
         basis: Set[Tuple[str, str]] = set()
 
         def try_add_candidate(candidate_edge_id: Tuple[str, str]) -> None:
             from_node, to_node = candidate_edge_id
-            if dsu.union(from_node, to_node):
+            if dsu.union(id_to_index[from_node], id_to_index[to_node]):
                 basis.add(candidate_edge_id)
         
         for edge_id in sorted(partial_basis):
@@ -93,19 +98,35 @@ class BasisRebuilder:
         return basis
 
 class PrebuiltInitializer(InitializationStrategy):
-    """Mock-initializer for setting a constant initial basis"""
-    
-    def __init__(self, basis: Set[Tuple[str, str]], flows: Dict[Tuple[str, str], float]):
+    """
+    Mock-initializer for setting a constant initial basis.
+
+    Accepts either the legacy form (set of edge-id tuples plus a flow dict)
+    or the array form (boolean basis mask and float flow vector indexed by
+    CSR edge id). Array inputs carry no per-edge tuples or hashing until
+    execute() translates them once for the solver.
+    """
+
+    def __init__(self, basis, flows):
         self.basis = basis
         self.flows = flows
-            
+
     def execute(self, graph: Graph) -> BasisResult:
+        basis = self.basis
+        flows = self.flows
+        if isinstance(basis, np.ndarray):
+            edge_ids = graph.csr().edge_ids
+            basis = {edge_ids[i] for i in np.flatnonzero(basis)}
+            flows = {
+                edge_ids[i]: float(flow) for i, flow in enumerate(self.flows)
+            }
+
         all_edges = set(graph.edges.keys())
-        non_basis = all_edges - self.basis
+        non_basis = all_edges - basis
         return BasisResult(
-            basis_edges=self.basis,
+            basis_edges=basis,
             non_basis_edges=non_basis,
-            flows=self.flows
+            flows=flows
         )
 
 
@@ -143,9 +164,7 @@ class PhaseOneInitializer(InitializationStrategy):
                 "Sum of supply must equal sum of demand."
             )
         
-        aux_graph = self._create_auxiliary_graph(graph)
-        
-        initial_basis, initial_flows = self._setup_initial_state(graph)
+        aux_graph, initial_basis, initial_flows = self.build_phase1_artifacts(graph)
 
         if not self.solver_factory:
             from ..transport_solver import TransportSolver
@@ -166,68 +185,119 @@ class PhaseOneInitializer(InitializationStrategy):
         
         return self._extract_original_solution(graph, final_state)
     
+    def build_phase1_artifacts(
+        self, graph: Graph
+    ) -> Tuple[Graph, Set[Tuple[str, str]], Dict[Tuple[str, str], float]]:
+        """
+        Auxiliary graph plus the initial basis and flows from one node scan.
+
+        The sorted label/balance arrays are computed once and shared between
+        the graph construction and the initial-state setup, which otherwise
+        each re-sort the same node dict.
+        """
+        csr = graph.csr()
+        sorted_labels, sorted_balances = self._sorted_node_arrays(graph)
+        aux_graph = self._assemble_auxiliary_graph(
+            csr, sorted_labels, sorted_balances
+        )
+        basis, flows = self._assemble_initial_state(
+            csr, sorted_labels, sorted_balances
+        )
+        return aux_graph, basis, flows
+
+    @staticmethod
+    def _sorted_node_arrays(graph: Graph) -> Tuple[np.ndarray, np.ndarray]:
+        """Node labels sorted lexicographically with balances aligned."""
+        csr = graph.csr()
+        labels = np.asarray(csr.labels)
+        order = np.argsort(labels, kind='stable')
+        return labels[order], csr.balances[order]
+
     def _create_auxiliary_graph(self, graph: Graph) -> Graph:
         """
         Create auxiliary graph for Phase 1.
         """
+        sorted_labels, sorted_balances = self._sorted_node_arrays(graph)
+        return self._assemble_auxiliary_graph(
+            graph.csr(), sorted_labels, sorted_balances
+        )
+
+    def _assemble_auxiliary_graph(
+        self,
+        csr,
+        sorted_labels: np.ndarray,
+        sorted_balances: np.ndarray
+    ) -> Graph:
+        """
+        Assemble the auxiliary graph from the CSR arrays in three bulk blocks
+        (nodes, zero-cost copies of the original edges, artificial arcs)
+        rather than one add_node/add_edge call per element.
+        """
         aux_graph = Graph()
-        
+
         aux_graph.add_node(self.ROOT_NODE_ID, balance=0.0)
-        
-        for node_id, node in sorted(graph.nodes.items()):
-            aux_graph.add_node(node_id, balance=node.balance)
-        
-        for _, edge in sorted(graph.edges.items()):
-            aux_graph.add_edge(
-                edge.from_node,
-                edge.to_node,
-                cost=self.ORIGINAL_COST,
-                capacity=edge.capacity
-            )
-        
-        # Add edges to all nodes (from node if node is source)
-        for node_id, node in sorted(graph.nodes.items()):
-            if node.balance > EPSILON:
-                aux_graph.add_edge(
-                    node_id,
-                    self.ROOT_NODE_ID,
-                    cost=self.ARTIFICIAL_COST,
-                    capacity=float('inf')
-                )
-            else:
-                aux_graph.add_edge(
-                    self.ROOT_NODE_ID,
-                    node_id,
-                    cost=self.ARTIFICIAL_COST,
-                    capacity=float('inf')
-                )
-        
+        aux_graph.add_nodes_bulk(sorted_labels.tolist(), sorted_balances.tolist())
+
+        # Original edges keep their capacity but carry zero cost in Phase 1.
+        # tolist() hands Edge plain Python floats — the CSR capacity array
+        # may be narrowed to float32, which must not leak into Edge fields
+        # and from there into the solver's flow/objective arithmetic
+        sorted_edge_ids = sorted(csr.edge_ids)
+        aux_graph.add_edges_bulk(
+            [edge_id[0] for edge_id in sorted_edge_ids],
+            [edge_id[1] for edge_id in sorted_edge_ids],
+            [self.ORIGINAL_COST] * len(sorted_edge_ids),
+            csr.capacity[[csr.edge_index[edge_id] for edge_id in sorted_edge_ids]].tolist()
+        )
+
+        # One artificial arc per node: sources feed the root, all other
+        # nodes are fed from it (np.where promotes to the wider str dtype)
+        num_nodes = len(sorted_labels)
+        is_source = sorted_balances > EPSILON
+        aux_graph.add_edges_bulk(
+            np.where(is_source, sorted_labels, self.ROOT_NODE_ID).tolist(),
+            np.where(is_source, self.ROOT_NODE_ID, sorted_labels).tolist(),
+            [self.ARTIFICIAL_COST] * num_nodes,
+            [float('inf')] * num_nodes
+        )
+
         return aux_graph
     
     def _setup_initial_state(self, graph: Graph) -> Tuple[Set[Tuple[str, str]], Dict[Tuple[str, str], float]]:
         """
         Set up initial basis and flows for Phase 1.
         """
+        sorted_labels, sorted_balances = self._sorted_node_arrays(graph)
+        return self._assemble_initial_state(
+            graph.csr(), sorted_labels, sorted_balances
+        )
+
+    def _assemble_initial_state(
+        self,
+        csr,
+        sorted_labels: np.ndarray,
+        sorted_balances: np.ndarray
+    ) -> Tuple[Set[Tuple[str, str]], Dict[Tuple[str, str], float]]:
+        """
+        Initial basis and flows: the artificial arcs carry each node's
+        absolute balance, the original edges start empty.
+        """
         basis: Set[Tuple[str, str]] = set()
-        flows: Dict[Tuple[str, str], float] = {}
-        
-        for edge_id in sorted(graph.edges.keys()):
-            flows[edge_id] = 0.0
-            
-        for node_id, node in sorted(graph.nodes.items()):
-            if node.balance > EPSILON:
+        flows: Dict[Tuple[str, str], float] = {
+            edge_id: 0.0 for edge_id in sorted(csr.edge_ids)
+        }
+
+        for node_id, balance in zip(
+            sorted_labels.tolist(), sorted_balances.tolist()
+        ):
+            if balance > EPSILON:
                 edge_id = (node_id, self.ROOT_NODE_ID)
-                basis.add(edge_id)
-                flows[edge_id] = node.balance
+                flows[edge_id] = balance
             else:
                 edge_id = (self.ROOT_NODE_ID, node_id)
-                basis.add(edge_id)
-                
-                if node.balance < -EPSILON:
-                    flows[edge_id] = abs(node.balance)
-                else:
-                    flows[edge_id] = 0.0
-        
+                flows[edge_id] = -balance if balance < -EPSILON else 0.0
+            basis.add(edge_id)
+
         return basis, flows
     
     def _extract_original_solution(self, graph: Graph, final_state: SolutionState) -> BasisResult:
@@ -246,40 +316,47 @@ class PhaseOneInitializer(InitializationStrategy):
         """
         if final_state.flows is None:
             raise ValueError("Solver did not produce a solution")
-        
+
+        # One pass over the auxiliary flows: sum the artificial arcs and
+        # collect the original-edge flows at the same time
+        root = self.ROOT_NODE_ID
         artificial_flow = 0.0
+        flows: Dict[Tuple[str, str], float] = {}
         for edge_id, flow in final_state.flows.items():
-            if self.ROOT_NODE_ID in edge_id:
+            if root in edge_id:
                 artificial_flow += flow
-        
+            else:
+                flows[edge_id] = flow
+
         if artificial_flow > EPSILON:
             raise ValueError(
                 f"Problem is infeasible. Total artificial flow: {artificial_flow:.6f}"
             )
-        
+
         original_edges = set(graph.edges.keys())
-        basis_edges: Set[Tuple[str, str]] = set()
-        flows: Dict[Tuple[str, str], float] = {}
-        
         for edge_id in original_edges:
-            flows[edge_id] = final_state.flows.get(edge_id, 0.0)
-        
-        if final_state.basis_edges:
-            for edge_id in final_state.basis_edges:
-                if self.ROOT_NODE_ID not in edge_id:
-                    basis_edges.add(edge_id)
-        
+            flows.setdefault(edge_id, 0.0)
+
+        basis_edges: Set[Tuple[str, str]] = {
+            edge_id for edge_id in (final_state.basis_edges or ())
+            if root not in edge_id
+        }
+
         basis_edges = BasisRebuilder.rebuild_basis(graph, basis_edges, flows)
-        
+
         non_basis_edges = original_edges - basis_edges
-        
+
         return BasisResult(
             basis_edges=basis_edges,
             non_basis_edges=non_basis_edges,
             flows=flows
         )
-    
-    
+
+
+# PhaseOneInitializer keeps no per-solve state, so callers that don't need
+# a custom solver_factory can share this instance instead of constructing
+# a fresh one per phase
+DEFAULT_PHASE_ONE_INITIALIZER = PhaseOneInitializer()
 
 
 class NorthwestCornerInitializer(InitializationStrategy):
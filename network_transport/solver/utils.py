@@ -11,7 +11,7 @@ from network_transport.models.edge import Edge
 
 # Initialization Strategy
 
-@dataclass
+@dataclass(slots=True)
 class BasisResult:
     """Result of initialization strategy."""
     basis_edges: Set[Tuple[str, str]]
@@ -0,0 +1,46 @@
+"""
+Pure-numeric helpers for the render hot path.
+
+Written as standalone functions over plain arrays and scalars so they
+can be JIT-compiled when numba is installed; without numba they run as
+ordinary NumPy code with identical results.
+"""
+
+try:
+    from numba import njit
+except ImportError:  # numba is an optional accelerator, not a dependency
+    njit = None
+
+
+def autoscale_bounds(positions, padding, extra, min_size):
+    """
+    Compute padded axis bounds around node positions.
+
+    Args:
+        positions: (N, 2) float64 array of node positions
+        padding: Horizontal/vertical padding around the extremes
+        extra: Additional vertical headroom for supply/demand arrows
+        min_size: Minimum extent of each axis range
+
+    Returns:
+        (x_min, x_max, y_min, y_max) tuple
+    """
+    x_min = positions[:, 0].min() - padding
+    x_max = positions[:, 0].max() + padding
+    y_min = positions[:, 1].min() - padding - extra
+    y_max = positions[:, 1].max() + padding + extra
+
+    if x_max - x_min < min_size:
+        center = (x_min + x_max) / 2.0
+        x_min = center - min_size / 2.0
+        x_max = center + min_size / 2.0
+    if y_max - y_min < min_size:
+        center = (y_min + y_max) / 2.0
+        y_min = center - min_size / 2.0
+        y_max = center + min_size / 2.0
+
+    return x_min, x_max, y_min, y_max
+
+
+if njit is not None:
+    autoscale_bounds = njit(cache=True)(autoscale_bounds)
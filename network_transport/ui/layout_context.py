@@ -1,6 +1,8 @@
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
+import numpy as np
+
 
 @dataclass
 class EdgeVisualData:
@@ -26,11 +28,32 @@ class LayoutContext:
         
         # Layout state
         self._is_fixed: bool = False
-    
+
+        # Lazily built NumPy views over node_positions (invalidated on change)
+        self._pos_array: Optional[np.ndarray] = None
+        self._node_index: Dict[str, int] = {}
+        self._edge_index_cache: Dict[
+            Tuple[Tuple[str, str], ...], Tuple[np.ndarray, np.ndarray]
+        ] = {}
+
     def set_node_position(self, node_id: str, x: float, y: float) -> None:
         """Set the visual position of a node."""
         self.node_positions[node_id] = (x, y)
+        self._pos_array = None
+        if node_id not in self._node_index:
+            # Node set changed: cached index arrays are stale too
+            self._node_index = {}
+            self._edge_index_cache.clear()
     
+    def set_node_positions_bulk(self, node_ids: List[str], xs, ys) -> None:
+        """Set positions for many nodes in one pass (xs/ys are sequences)."""
+        positions = self.node_positions
+        for node_id, x, y in zip(node_ids, xs, ys):
+            positions[node_id] = (float(x), float(y))
+        self._pos_array = None
+        self._node_index = {}
+        self._edge_index_cache.clear()
+
     def get_node_position(self, node_id: str) -> Tuple[float, float] | None:
         """Get the visual position of a node, or None if not set."""
         return self.node_positions.get(node_id)
@@ -69,6 +92,56 @@ class LayoutContext:
             self.edge_metadata[edge_id] = EdgeVisualData()
         return self.edge_metadata[edge_id]
     
+    def _ensure_pos_array(self) -> np.ndarray:
+        """Rebuild the (N, 2) position array if positions changed."""
+        if self._pos_array is None:
+            if not self._node_index:
+                self._node_index = {
+                    node_id: i for i, node_id in enumerate(self.node_positions)
+                }
+            self._pos_array = np.asarray(
+                list(self.node_positions.values()), dtype=np.float64
+            )
+        return self._pos_array
+
+    def positions_array(self) -> np.ndarray:
+        """
+        Get all node positions as a cached (N, 2) float64 array.
+
+        The array is invalidated when positions change; callers must not
+        mutate it.
+        """
+        return self._ensure_pos_array()
+
+    def get_edge_segments(self, edge_ids: List[Tuple[str, str]]) -> np.ndarray:
+        """
+        Assemble endpoint segments for the given edges in one vectorized pass.
+
+        Args:
+            edge_ids: Edges as (from_node, to_node) tuples; all endpoints
+                must have positions set
+
+        Returns:
+            Array of shape (E, 2, 2): per edge, start and end (x, y)
+        """
+        pos_array = self._ensure_pos_array()
+
+        key = tuple(edge_ids)
+        cached = self._edge_index_cache.get(key)
+        if cached is None:
+            index = self._node_index
+            from_idx = np.fromiter(
+                (index[e[0]] for e in edge_ids), dtype=np.int32, count=len(edge_ids)
+            )
+            to_idx = np.fromiter(
+                (index[e[1]] for e in edge_ids), dtype=np.int32, count=len(edge_ids)
+            )
+            cached = (from_idx, to_idx)
+            self._edge_index_cache[key] = cached
+
+        from_idx, to_idx = cached
+        return np.stack([pos_array[from_idx], pos_array[to_idx]], axis=1)
+
     def is_layout_fixed(self) -> bool:
         """Check if the layout is locked from editing."""
         return self._is_fixed
@@ -90,3 +163,6 @@ class LayoutContext:
         self.node_positions.clear()
         self.edge_metadata.clear()
         self._is_fixed = False
+        self._pos_array = None
+        self._node_index = {}
+        self._edge_index_cache.clear()
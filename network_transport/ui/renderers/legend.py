@@ -16,9 +16,13 @@ class LegendRenderer:
         
         self.ax = ax
         self.style = style
-    
+        self._drawn = False
+
     def draw_legend(self) -> None:
-        """Draw legend with node and edge type information."""
+        """Draw legend with node and edge type information (static: drawn once)."""
+        if self._drawn:
+            return
+
         self.ax.clear()
         self.ax.axis('off')
         
@@ -61,7 +65,7 @@ class LegendRenderer:
             self.ax.text(0.25, y_pos, label, ha='left', va='center', # pyright: ignore[reportUnknownMemberType]
                         fontsize=8, transform=self.ax.transAxes)
             y_pos -= 0.10
-        
+
         # Edge types section
         y_pos -= 0.05
         self.ax.text(0.1, y_pos, 'Edge Types:', ha='left', va='top', # pyright: ignore[reportUnknownMemberType]
@@ -78,10 +82,12 @@ class LegendRenderer:
         for label, color, linestyle, linewidth in edge_types:
             # Draw line
             self.ax.plot([0.12, 0.22], [y_pos, y_pos],  # pyright: ignore[reportUnknownMemberType]
-                        color=color, linestyle=linestyle, 
+                        color=color, linestyle=linestyle,
                         linewidth=linewidth, transform=self.ax.transAxes)
-            
+
             # Draw label
             self.ax.text(0.25, y_pos, label, ha='left', va='center', # pyright: ignore[reportUnknownMemberType]
                         fontsize=8, transform=self.ax.transAxes)
             y_pos -= 0.10
+
+        self._drawn = True
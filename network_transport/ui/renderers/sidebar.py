@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Optional, List
 from matplotlib.axes import Axes
 import matplotlib.patches as mpatches
@@ -6,6 +7,62 @@ from network_transport.models.graph import Graph
 from network_transport.solver.utils import SolutionState
 
 
+# Positional %-template: one formatting pass, no per-field parsing
+_INFO_TMPL = (
+    "Problem Size:\n"
+    "  Nodes: %d\n"
+    "  Edges: %d\n\n"
+    "Balance:\n"
+    "  Supply: %.0f\n"
+    "  Demand: %.0f\n\n"
+    "Objective: %.2f"
+)
+
+
+@lru_cache(maxsize=64)
+def _format_info(
+    num_nodes: int, num_edges: int, supply: float, demand: float, objective: float
+) -> str:
+    """Format the sidebar statistics block (consecutive frames often repeat it)."""
+    return _INFO_TMPL % (num_nodes, num_edges, supply, demand, objective)
+
+
+@lru_cache(maxsize=256)
+def _wrap_text_cached(text: str, max_width: int) -> str:
+    """
+    Wrap text to fit within max width.
+
+    Cached: the same step log is re-wrapped on every blit/redraw, and
+    navigation replays previously seen logs verbatim.
+    """
+    lines = text.split('\n')
+
+    # Fast path: nothing to wrap
+    if all(len(line) <= max_width for line in lines):
+        return text
+
+    wrapped_lines: List[str] = []
+    for line in lines:
+        if len(line) <= max_width:
+            wrapped_lines.append(line)
+        else:
+            # Wrap long lines
+            while len(line) > max_width:
+                # Find last space before max_width
+                wrap_pos = line.rfind(' ', 0, max_width)
+                if wrap_pos == -1:
+                    # No space found, hard break
+                    wrap_pos = max_width
+
+                wrapped_lines.append(line[:wrap_pos])
+                line = line[wrap_pos:].lstrip()
+
+            if line:
+                wrapped_lines.append(line)
+
+    return '\n'.join(wrapped_lines)
+
+
 class SidebarRenderer:
     """Renders problem statistics sidebar with optional console log."""
     
@@ -16,18 +73,78 @@ class SidebarRenderer:
         self.current_step_log: str = ""
         self.show_console_log = True
         self.max_line_width = 50  # Max characters per line for wrapping
-    
+
+        # Blitting state for fast console-log updates
+        self._log_text = None  # Text artist reused between messages
+        self._bg = None        # Cached sidebar background (without log text)
+
+        # Full redraw needed on next draw_sidebar call
+        self._dirty = True
+
+        # Supply/demand totals cached against the graph's size; the graph
+        # is static for a session, so the per-redraw node scan runs once
+        self._totals_key = None
+        self._totals = (0.0, 0.0)
+
     def add_console_message(self, message: str) -> None:
         """Set current step log (replaces previous)."""
         self.current_step_log = message
+        # Blitting keeps the axes current; only mark dirty if it failed
+        if not self._blit_console_log():
+            self._dirty = True
+
+    def _blit_console_log(self) -> bool:
+        """
+        Fast-path update of the console text via blitting.
+
+        Restores a cached background and redraws only the log Text artist,
+        avoiding a full sidebar clear/redraw per message.
+
+        Returns:
+            True if the blit update was performed, False if a full redraw
+            is needed (no artist yet, or canvas doesn't support blitting).
+        """
+        if not self.show_console_log or self._log_text is None:
+            return False
+
+        fig = self.ax.get_figure()
+        canvas = getattr(fig, 'canvas', None)
+        if canvas is None or not canvas.supports_blit:
+            return False
+
+        try:
+            if self._bg is None:
+                self._capture_background(canvas)
+
+            wrapped = self._wrap_text(
+                self.current_step_log, self._calculate_adaptive_line_width()
+            )
+            canvas.restore_region(self._bg)
+            self._log_text.set_text(wrapped)
+            self.ax.draw_artist(self._log_text)
+            canvas.blit(self.ax.bbox)
+            return True
+        except Exception:
+            # Fall back to full redraw on next draw_sidebar call
+            self._bg = None
+            return False
+
+    def _capture_background(self, canvas) -> None:
+        """Cache the sidebar background with the log text hidden."""
+        self._log_text.set_visible(False)
+        canvas.draw()
+        self._bg = canvas.copy_from_bbox(self.ax.bbox)
+        self._log_text.set_visible(True)
     
     def clear_console_log(self) -> None:
         """Clear console log."""
         self.current_step_log = ""
-    
+        self._dirty = True
+
     def set_show_console_log(self, show: bool) -> None:
         """Toggle console log visibility."""
         self.show_console_log = show
+        self._dirty = True
     
     def _calculate_adaptive_fontsize(self) -> float:
         """Calculate adaptive font size based on sidebar dimensions."""
@@ -66,34 +183,22 @@ class SidebarRenderer:
     
     def _wrap_text(self, text: str, max_width: int) -> str:
         """Wrap text to fit within max width."""
-        lines = text.split('\n')
-        wrapped_lines = []
-        
-        for line in lines:
-            if len(line) <= max_width:
-                wrapped_lines.append(line)
-            else:
-                # Wrap long lines
-                while len(line) > max_width:
-                    # Find last space before max_width
-                    wrap_pos = line.rfind(' ', 0, max_width)
-                    if wrap_pos == -1:
-                        # No space found, hard break
-                        wrap_pos = max_width
-                    
-                    wrapped_lines.append(line[:wrap_pos])
-                    line = line[wrap_pos:].lstrip()
-                
-                if line:
-                    wrapped_lines.append(line)
-        
-        return '\n'.join(wrapped_lines)
+        return _wrap_text_cached(text, max_width)
     
     def draw_sidebar(self, state: Optional[SolutionState]=None) -> None:
+        # Skip the redraw when nothing changed since the last draw
+        if not self._dirty and state is self.state:
+            return
+
         self.state = state
-        
+        self._dirty = False
+
         self.ax.clear()
         self.ax.axis('off')
+
+        # Full redraw invalidates the cached blit background and artist
+        self._log_text = None
+        self._bg = None
         
         # Draw background rectangle
         bg_rect = mpatches.Rectangle((0, 0), 1, 1, 
@@ -111,7 +216,7 @@ class SidebarRenderer:
             
             # Show console log with text wrapping
             wrapped_text = self._wrap_text(self.current_step_log, line_width)
-            self.ax.text( # pyright: ignore[reportUnknownMemberType]
+            self._log_text = self.ax.text( # pyright: ignore[reportUnknownMemberType]
                 0.02, 0.98,
                 wrapped_text,
                 ha='left', va='top', fontsize=fontsize, family='monospace',
@@ -121,21 +226,12 @@ class SidebarRenderer:
             # Show problem statistics
             num_nodes = len(self.graph.nodes)
             num_edges = len(self.graph.edges)
-            
-            supply = sum(n.balance for n in self.graph.nodes.values() if n.balance > 0)
-            demand = -sum(n.balance for n in self.graph.nodes.values() if n.balance < 0)
-            
+
+            supply, demand = self._problem_totals()
+
             objective = self._calculate_objective()
-            
-            info_text = (
-                f"Problem Size:\n"
-                f"  Nodes: {num_nodes}\n"
-                f"  Edges: {num_edges}\n\n"
-                f"Balance:\n"
-                f"  Supply: {supply:.0f}\n"
-                f"  Demand: {demand:.0f}\n\n"
-                f"Objective: {objective:.2f}"
-            )
+
+            info_text = _format_info(num_nodes, num_edges, supply, demand, objective)
             
             self.ax.text( # pyright: ignore[reportUnknownMemberType]
                 0.5, 0.5,
@@ -143,6 +239,19 @@ class SidebarRenderer:
                 ha='center', va='center', fontsize=9, family='monospace'
             )
     
+    def _problem_totals(self) -> tuple:
+        """Total supply and demand, recomputed only if the graph changed size."""
+        key = (len(self.graph.nodes), len(self.graph.edges))
+        if key != self._totals_key:
+            # Two clipped reductions over the cached balance vector instead
+            # of a Python-level scan of the node dict
+            balances = self.graph.csr().balances
+            supply = float(balances.clip(min=0.0).sum())
+            demand = float((-balances).clip(min=0.0).sum())
+            self._totals_key = key
+            self._totals = (supply, demand)
+        return self._totals
+
     def _calculate_objective(self) -> float:
         if self.state is None:
             return 0.0
@@ -1,6 +1,12 @@
-from matplotlib.patches import Circle, FancyArrowPatch
+import math
+from functools import lru_cache
+
+import numpy as np
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.offsetbox import AnnotationBbox, OffsetImage
+from matplotlib.patches import Circle, FancyArrow
 from matplotlib.text import Text
-from typing import Dict, Tuple, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 from ..models.node import Node
 from ..models.graph import Graph
 from .layout_context import LayoutContext
@@ -10,6 +16,108 @@ from .geometry import calculate_label_position
 if TYPE_CHECKING:
     from .view_models import EdgeViewModel, NodeViewModel
 
+_INF = math.inf
+
+# Shared bbox specs: matplotlib copies properties out of these, so one
+# dict per style is enough for every label instead of one per call.
+_POTENTIAL_BBOX = dict(
+    boxstyle='round,pad=0.3', facecolor='white', edgecolor='gray', alpha=0.8
+)
+_EDGE_LABEL_BBOX = dict(
+    boxstyle='round,pad=0.3', facecolor='white', edgecolor='gray', alpha=0.9
+)
+
+# DPI used when rasterizing labels into the pixmap cache
+_LABEL_RASTER_DPI = 100
+
+
+class CachedText(Text):
+    """
+    Text artist that memoizes glyph layout across identical labels.
+
+    Matplotlib rebuilds text layout on every draw; edge labels are short
+    strings that repeat across edges and redraws, so the layout is cached
+    by (text, font style, dpi) and shared between artists.
+    """
+
+    _LAYOUT_CACHE_MAX = 4096
+    _layout_cache: Dict[tuple, tuple] = {}
+
+    def _get_layout(self, renderer):
+        key = (
+            self.get_text(),
+            self.get_fontsize(),
+            self.get_fontweight(),
+            self.get_fontstyle(),
+            tuple(self.get_fontfamily()),
+            getattr(renderer, 'dpi', 0)
+        )
+        cached = self._layout_cache.get(key)
+        if cached is None:
+            cached = super()._get_layout(renderer)
+            if len(self._layout_cache) >= self._LAYOUT_CACHE_MAX:
+                self._layout_cache.clear()
+            self._layout_cache[key] = cached
+        return cached
+
+# bbox specs selectable by cache key (lru_cache needs hashable arguments)
+_RASTER_BBOXES = {'potential': _POTENTIAL_BBOX}
+
+
+@lru_cache(maxsize=1024)
+def _rasterize_label(
+    text: str,
+    fontsize: float,
+    fontweight: str,
+    color: str,
+    bbox_key: Optional[str] = None
+) -> np.ndarray:
+    """
+    Rasterize a label once into a tight RGBA array.
+
+    Many labels repeat the same short strings across nodes and redraws;
+    rendering each unique (text, style) combination a single time avoids
+    matplotlib's per-Text layout and rasterization cost on every draw.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(4, 2), dpi=_LABEL_RASTER_DPI)
+    fig.patch.set_visible(False)
+    canvas = FigureCanvasAgg(fig)
+    artist = fig.text(
+        0.5, 0.5, text,
+        ha='center', va='center',
+        fontsize=fontsize, fontweight=fontweight, color=color,
+        bbox=_RASTER_BBOXES.get(bbox_key)
+    )
+    canvas.draw()
+
+    bbox = artist.get_window_extent(canvas.get_renderer()).padded(4)
+    buf = np.asarray(canvas.buffer_rgba())
+    height = buf.shape[0]
+    x0 = max(int(bbox.x0), 0)
+    x1 = min(int(math.ceil(bbox.x1)), buf.shape[1])
+    y0 = max(int(bbox.y0), 0)
+    y1 = min(int(math.ceil(bbox.y1)), height)
+    # Image rows run top-down while display coordinates run bottom-up
+    return buf[height - y1:height - y0, x0:x1].copy()
+
+
+@lru_cache(maxsize=8192)
+def _format_edge_label(
+    flow: float,
+    cost: float,
+    capacity: float,
+    delta: Optional[float],
+    cycle_sign: Optional[str]
+) -> str:
+    """Format edge label text (cached: many edges share the same values across frames)."""
+    prefix = f"[{cycle_sign}]\n" if cycle_sign is not None else ""
+    cap = f"\nd={capacity:.0f}" if capacity != _INF else ""
+    delt = f"\nΔ={delta:+.1f}" if delta is not None else ""
+    return f"{prefix}x={flow:.0f}\nc={cost:.0f}{cap}{delt}"
+
 
 class LayoutAwareNodeRenderer:
     """Renders nodes using positions from LayoutContext."""
@@ -20,8 +128,8 @@ class LayoutAwareNodeRenderer:
         self.layout = layout
         self.style = style
         self.node_artists: Dict[str, Circle] = {}
-        self.node_labels: Dict[str, Text] = {}
-        self.potential_labels: Dict[str, Text] = {}
+        self.node_labels: Dict[str, AnnotationBbox] = {}
+        self.potential_labels: Dict[str, AnnotationBbox] = {}
     
     def draw_all_nodes(self, nodes: Dict[str, 'NodeViewModel']) -> None:
         """Draw all nodes using layout context positions."""
@@ -32,9 +140,11 @@ class LayoutAwareNodeRenderer:
                 self._draw_single_node(node, pos)
     
     def _clear_artifacts(self) -> None:
-        self.node_artists.clear()
-        self.node_labels.clear()
-        self.potential_labels.clear()
+        """Detach this renderer's artists from the axes (no full ax.clear())."""
+        for registry in (self.node_artists, self.node_labels, self.potential_labels):
+            for artist in registry.values():
+                artist.remove()
+            registry.clear()
     
     def _draw_single_node(self, node: 'NodeViewModel', position: Tuple[float, float]) -> None:
         """Draw a single node at given position."""
@@ -55,109 +165,217 @@ class LayoutAwareNodeRenderer:
         self.node_artists[node.id] = circle
     
     def _create_node_label(self, node: 'NodeViewModel', position: Tuple[float, float]) -> None:
-        """Create node label text."""
+        """Create node label from the shared pixmap cache."""
         x, y = position
         label_text = f"{node.id}\n[{node.balance:+.0f}]"
-        label = self.ax.text(
-            x, y, label_text,
-            ha='center', va='center',
-            fontsize=self.style.node.label_font_size,
-            fontweight=self.style.node.label_font_weight,
-            color=self.style.node.label_color,
-            zorder=11
+        label = self._place_cached_label(
+            label_text, (x, y),
+            zorder=11,
+            **self.style.node_label_kwargs
         )
         self.node_labels[node.id] = label
-    
+
     def _create_potential_label(self, node: 'NodeViewModel', position: Tuple[float, float]) -> None:
-        """Create potential label text if potential is set."""
+        """Create potential label if potential is set."""
         if node.potential is None:
             return
-        
+
         x, y = position
         offset_y = self.style.node.radius + self.style.node.potential_label_offset
         potential_text = f"u={node.potential:.1f}"
-        label = self.ax.text(
-            x, y + offset_y, potential_text,
-            ha='center', va='bottom',
-            fontsize=self.style.node.potential_font_size,
-            color=self.style.node.potential_color,
-            bbox=dict(
-                boxstyle='round,pad=0.3',
-                facecolor='white',
-                edgecolor='gray',
-                alpha=0.8
-            ),
-            zorder=12
+        label = self._place_cached_label(
+            potential_text, (x, y + offset_y),
+            zorder=12,
+            bbox_key='potential',
+            box_alignment=(0.5, 0.0),
+            **self.style.potential_label_kwargs
         )
         self.potential_labels[node.id] = label
 
+    def _place_cached_label(
+        self,
+        text: str,
+        position: Tuple[float, float],
+        fontsize: float,
+        fontweight: str,
+        color: str,
+        zorder: int,
+        bbox_key: Optional[str] = None,
+        box_alignment: Tuple[float, float] = (0.5, 0.5)
+    ) -> AnnotationBbox:
+        """Place a label using the rasterized pixmap cache (one render per unique text)."""
+        pixmap = _rasterize_label(text, fontsize, fontweight, color, bbox_key)
+        # OffsetImage applies a renderer.dpi/72 correction at draw time
+        # (dpi_cor), so a 72/_LABEL_RASTER_DPI zoom yields an effective
+        # scale of renderer.dpi/_LABEL_RASTER_DPI — sized like the original
+        # Text labels on screen and at the 300 DPI save path alike
+        image = OffsetImage(pixmap, zoom=72.0 / _LABEL_RASTER_DPI)
+        label = AnnotationBbox(
+            image, position,
+            frameon=False, box_alignment=box_alignment, zorder=zorder
+        )
+        self.ax.add_artist(label)
+        return label
+
 
 class LayoutAwareEdgeRenderer:
     """Renders edges using positions from LayoutContext."""
-    
+
+    # Extra viewport fraction kept around the visible area so edges with
+    # slightly off-screen endpoints still render
+    CULL_MARGIN_RATIO = 0.1
+
+    # Arrowhead geometry in data units
+    HEAD_LENGTH = 0.35
+    HEAD_WIDTH = 0.3
+
     def __init__(self, ax, graph: Graph, layout: LayoutContext, style: VisualStyle):
         self.ax = ax
         self.graph = graph
         self.layout = layout
         self.style = style
         self.edge_labels: Dict[Tuple[str, str], Text] = {}
-        self.edge_arrows: Dict[Tuple[str, str], FancyArrowPatch] = {}
-    
+
+        # All edge lines live in one LineCollection (plus one PolyCollection
+        # of arrowheads) instead of one patch artist per edge
+        self.edge_collection: Optional[LineCollection] = None
+        self.head_collection: Optional[PolyCollection] = None
+        self.edge_index: Dict[Tuple[str, str], int] = {}
+        self._segments: Optional[np.ndarray] = None
+
     def draw_all_edges(self, edges: Dict[Tuple[str, str], 'EdgeViewModel']) -> None:
         """Draw all edges using layout context positions."""
         self._clear_artifacts()
-        for edge in edges.values():
-            if self._has_valid_positions(edge):
-                self._draw_single_edge(edge)
+        drawable = [
+            edge for edge in edges.values() if self._has_valid_positions(edge)
+        ]
+        if not drawable:
+            return
+
+        # Assemble all endpoint segments in one vectorized pass
+        segments = self.layout.get_edge_segments([e.edge_id for e in drawable])
+
+        # Skip edges (and their labels) fully outside the current viewport
+        visible = self._visible_mask(segments)
+        if visible is not None and not visible.all():
+            drawable = [edge for edge, keep in zip(drawable, visible) if keep]
+            segments = segments[visible]
+
+        self.edge_index = {edge.edge_id: i for i, edge in enumerate(drawable)}
+        self._segments = segments
+
+        styles = [
+            self.style.get_edge_style_params(e.is_basis, e.violates_optimality())
+            for e in drawable
+        ]
+        colors = [s['color'] for s in styles]
+        widths = [s['linewidth'] for s in styles]
+        dashes = [s['linestyle'] for s in styles]
+
+        shafts, heads = self._arrow_geometry(segments)
+        self.edge_collection = LineCollection(
+            shafts, colors=colors, linewidths=widths, linestyles=dashes, zorder=5
+        )
+        self.ax.add_collection(self.edge_collection)
+        self.head_collection = PolyCollection(
+            heads, facecolors=colors, edgecolors=colors, zorder=5
+        )
+        self.ax.add_collection(self.head_collection)
+
+        for edge, segment in zip(drawable, segments):
+            self._create_edge_label(edge, segment[0], segment[1])
+
+    def _arrow_geometry(
+        self, segments: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized shaft and arrowhead geometry for all edges.
+
+        Shafts are shrunk by the node radius at both ends; each head is a
+        triangle whose tip touches the target node boundary.
+        """
+        p1 = segments[:, 0, :]
+        p2 = segments[:, 1, :]
+        direction = p2 - p1
+        length = np.hypot(direction[:, 0], direction[:, 1])
+        length[length == 0] = 1.0
+        unit = direction / length[:, None]
+
+        radius = self.style.node.radius
+        start = p1 + unit * radius
+        tip = p2 - unit * radius
+        base = tip - unit * self.HEAD_LENGTH
+        perp = np.stack([-unit[:, 1], unit[:, 0]], axis=1) * (self.HEAD_WIDTH / 2)
+
+        shafts = np.stack([start, base], axis=1)
+        heads = np.stack([tip, base + perp, base - perp], axis=1)
+        return shafts, heads
+
+    def update_edge_positions(self, edge_ids: List[Tuple[str, str]]) -> None:
+        """Refresh collection rows for the given edges (drag fast path)."""
+        if self.edge_collection is None or self._segments is None:
+            return
+
+        for edge_id in edge_ids:
+            i = self.edge_index.get(edge_id)
+            if i is None:
+                continue
+            pos1 = self.layout.get_node_position(edge_id[0])
+            pos2 = self.layout.get_node_position(edge_id[1])
+            if pos1 is None or pos2 is None:
+                continue
+            self._segments[i, 0, :] = pos1
+            self._segments[i, 1, :] = pos2
+
+        shafts, heads = self._arrow_geometry(self._segments)
+        self.edge_collection.set_segments(shafts)
+        self.head_collection.set_verts(heads)
+
+    def _visible_mask(self, segments):
+        """
+        Boolean mask of edges with at least one endpoint near the viewport.
+
+        Returns None when axis limits are still autoscaled (initial render),
+        in which case every edge is drawn.
+        """
+        if self.ax.get_autoscalex_on() or self.ax.get_autoscaley_on():
+            return None
+
+        x_min, x_max = self.ax.get_xlim()
+        y_min, y_max = self.ax.get_ylim()
+        margin_x = (x_max - x_min) * self.CULL_MARGIN_RATIO
+        margin_y = (y_max - y_min) * self.CULL_MARGIN_RATIO
+
+        xs = segments[:, :, 0]
+        ys = segments[:, :, 1]
+        inside = (
+            (xs >= x_min - margin_x) & (xs <= x_max + margin_x) &
+            (ys >= y_min - margin_y) & (ys <= y_max + margin_y)
+        )
+        return inside.any(axis=1)
     
     def _clear_artifacts(self) -> None:
+        """Detach this renderer's artists from the axes (no full ax.clear())."""
+        for artist in self.edge_labels.values():
+            artist.remove()
         self.edge_labels.clear()
-        self.edge_arrows.clear()
-    
+
+        if self.edge_collection is not None:
+            self.edge_collection.remove()
+            self.edge_collection = None
+        if self.head_collection is not None:
+            self.head_collection.remove()
+            self.head_collection = None
+        self.edge_index = {}
+        self._segments = None
+
     def _has_valid_positions(self, edge: 'EdgeViewModel') -> bool:
         """Check if both nodes have positions in layout."""
-        return (self.layout.has_position(edge.from_node) and 
+        return (self.layout.has_position(edge.from_node) and
                 self.layout.has_position(edge.to_node))
-    
-    def _draw_single_edge(self, edge: 'EdgeViewModel') -> None:
-        """Draw a single edge."""
-        self._create_edge_arrow(edge)
-        self._create_edge_label(edge)
-    
-    def _create_edge_arrow(self, edge: 'EdgeViewModel') -> None:
-        """Create edge arrow patch."""
-        pos1 = self.layout.get_node_position(edge.from_node)
-        pos2 = self.layout.get_node_position(edge.to_node)
-        
-        style_params = self.style.get_edge_style_params(
-            edge.is_basis, edge.violates_optimality()
-        )
-        
-        # Calculate shrink distance to make arrows start/end at node boundaries
-        # Using node radius from style and converting to points (approximately)
-        node_radius = self.style.node.radius
-        # Convert from data coordinates to points (rough approximation)
-        shrink_distance = node_radius * 50  # Adjust multiplier as needed
-        
-        arrow = FancyArrowPatch(
-            pos1, pos2,
-            arrowstyle=style_params['arrowstyle'],
-            color=style_params['color'],
-            linewidth=style_params['linewidth'],
-            linestyle=style_params['linestyle'],
-            mutation_scale=style_params['mutation_scale'],
-            shrinkA=shrink_distance,  # Shrink from start node
-            shrinkB=shrink_distance,  # Shrink from end node
-            zorder=5
-        )
-        self.ax.add_patch(arrow)
-        self.edge_arrows[edge.edge_id] = arrow
-    
-    def _create_edge_label(self, edge: 'EdgeViewModel') -> None:
+
+    def _create_edge_label(self, edge: 'EdgeViewModel', pos1, pos2) -> None:
         """Create edge label text."""
-        pos1 = self.layout.get_node_position(edge.from_node)
-        pos2 = self.layout.get_node_position(edge.to_node)
-        
         # Ensure visual data exists for this edge
         visual_data = self.layout.ensure_edge_visual_data(edge.from_node, edge.to_node)
         
@@ -171,40 +389,23 @@ class LayoutAwareEdgeRenderer:
         # Build label text
         label_text = self._build_label_text(edge)
         
-        # Create text
-        label = self.ax.text(
+        # Create text with shared layout cache
+        label = CachedText(
             label_pos[0], label_pos[1], label_text,
             ha='center', va='center',
-            fontsize=self.style.edge.label_font_size,
-            bbox=dict(
-                boxstyle='round,pad=0.3',
-                facecolor='white',
-                edgecolor='gray',
-                alpha=0.9
-            ),
+            bbox=_EDGE_LABEL_BBOX,
             zorder=6,
-            picker=True
+            picker=True,
+            **self.style.edge_label_kwargs
         )
+        self.ax.add_artist(label)
         self.edge_labels[edge.edge_id] = label
     
     def _build_label_text(self, edge: 'EdgeViewModel') -> str:
         """Build label text for edge."""
-        parts = []
-        
-        # Add cycle sign if this edge is part of a cycle
-        if edge.cycle_sign is not None:
-            parts.append(f"[{edge.cycle_sign}]")
-        
-        parts.append(f"x={edge.flow:.0f}")
-        parts.append(f"c={edge.cost:.0f}")
-        
-        if edge.capacity != float('inf'):
-            parts.append(f"d={edge.capacity:.0f}")
-        
-        if edge.delta is not None:
-            parts.append(f"Δ={edge.delta:+.1f}")
-        
-        return "\n".join(parts)
+        return _format_edge_label(
+            edge.flow, edge.cost, edge.capacity, edge.delta, edge.cycle_sign
+        )
 
 
 class LayoutAwareSupplyDemandRenderer:
@@ -215,57 +416,75 @@ class LayoutAwareSupplyDemandRenderer:
         self.graph = graph
         self.layout = layout
         self.style = style
-    
+        self.arrow_artists: Dict[str, FancyArrow] = {}
+        self.balance_labels: Dict[str, Text] = {}
+
     def draw_supply_demand_arrows(self) -> None:
         """Draw supply and demand arrows for all nodes."""
+        for registry in (self.arrow_artists, self.balance_labels):
+            for artist in registry.values():
+                artist.remove()
+            registry.clear()
         for node in self.graph.nodes.values():
             pos = self.layout.get_node_position(node.id)
             if pos and node.balance != 0:
                 self._draw_arrow_for_node(node, pos)
-    
+
+    def move_artists_for_node(self, node_id: str, position: Tuple[float, float]) -> None:
+        """Reposition a node's supply/demand arrow and label in place (drag blitting)."""
+        arrow = self.arrow_artists.get(node_id)
+        label = self.balance_labels.get(node_id)
+        node = self.graph.nodes.get(node_id)
+        if node is None or (arrow is None and label is None):
+            return
+
+        x, y = position
+        arrow_length = self.style.supply_demand.arrow_length
+        if node.balance > 0:
+            if arrow is not None:
+                arrow.set_data(x=x, y=y + arrow_length, dx=0, dy=-arrow_length * 0.8)
+            if label is not None:
+                label.set_position((x, y + arrow_length + 0.3))
+        else:
+            if arrow is not None:
+                arrow.set_data(x=x, y=y - arrow_length, dx=0, dy=arrow_length * 0.8)
+            if label is not None:
+                label.set_position((x, y - arrow_length - 0.3))
+
     def _draw_arrow_for_node(self, node: Node, position: Tuple[float, float]) -> None:
         """Draw supply or demand arrow for a node."""
         x, y = position
         arrow_length = self.style.supply_demand.arrow_length
-        
+
         if node.balance > 0:  # Supply
             # Arrow pointing down into node
-            self.ax.arrow(
+            arrow = self.ax.arrow(
                 x, y + arrow_length, 0, -arrow_length * 0.8,
-                head_width=self.style.supply_demand.arrow_head_width,
-                head_length=self.style.supply_demand.arrow_head_length,
-                fc=self.style.supply_demand.supply_color,
-                ec=self.style.supply_demand.supply_color,
-                linewidth=self.style.supply_demand.arrow_line_width,
-                zorder=4
+                zorder=4,
+                **self.style.supply_arrow_kwargs
             )
             # Label
-            self.ax.text(
+            label = self.ax.text(
                 x, y + arrow_length + 0.3,
                 f"+{node.balance:.0f}",
                 ha='center', va='bottom',
-                fontsize=self.style.supply_demand.label_font_size,
-                fontweight='bold',
-                color=self.style.supply_demand.supply_color
+                **self.style.supply_label_kwargs
             )
-        
+
         elif node.balance < 0:  # Demand
             # Arrow pointing down from node
-            self.ax.arrow(
+            arrow = self.ax.arrow(
                 x, y - arrow_length, 0, arrow_length * 0.8,
-                head_width=self.style.supply_demand.arrow_head_width,
-                head_length=self.style.supply_demand.arrow_head_length,
-                fc=self.style.supply_demand.demand_color,
-                ec=self.style.supply_demand.demand_color,
-                linewidth=self.style.supply_demand.arrow_line_width,
-                zorder=4
+                zorder=4,
+                **self.style.demand_arrow_kwargs
             )
             # Label
-            self.ax.text(
+            label = self.ax.text(
                 x, y - arrow_length - 0.3,
                 f"{node.balance:.0f}",
                 ha='center', va='top',
-                fontsize=self.style.supply_demand.label_font_size,
-                fontweight='bold',
-                color=self.style.supply_demand.demand_color
+                **self.style.demand_label_kwargs
             )
+
+        self.arrow_artists[node.id] = arrow
+        self.balance_labels[node.id] = label
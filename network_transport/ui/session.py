@@ -1,15 +1,36 @@
 import matplotlib.pyplot as plt
+from contextlib import contextmanager
 from matplotlib.widgets import Button
-from typing import Optional
+from typing import List, Optional
 
 from ..models.graph import Graph
 from ..solver.controller import SolverController
-from ..solver.transport_solver import StepType
+from ..solver.utils import StepType
 from ..logging.solution_logger import SolutionLogger
 from .layout_context import LayoutContext
 from .visualizer import GraphVisualizer
 
 
+# Button-bar geometry in figure coordinates, snapshotted once:
+# five slots of [x, y, width, height] at 0.14 horizontal pitch
+_BUTTON_WIDTH = 0.12
+_BUTTON_RECTS: list[list[float]] = [
+    [0.1 + k * (_BUTTON_WIDTH + 0.02), 0.01, _BUTTON_WIDTH, 0.04]
+    for k in range(5)
+]
+
+
+_STEP_NAMES: dict[StepType, str] = {
+    StepType.INITIAL_BASIS: "Initial Basis",
+    StepType.CALCULATE_POTENTIALS: "Calculate Potentials",
+    StepType.CHECK_OPTIMALITY: "Check Optimality",
+    StepType.FIND_CYCLE: "Find Cycle",
+    StepType.CALCULATE_THETA: "Calculate θ",
+    StepType.UPDATE_FLOWS: "Update Flows",
+    StepType.OPTIMAL: "Optimal Solution"
+}
+
+
 class InteractiveSession:
     """Coordinates interactive solution session."""
     
@@ -42,11 +63,111 @@ class InteractiveSession:
         self._btn_solve_all = None
         self._btn_reset = None
         self._btn_toggle_console = None
+
+        # Draw debouncing: coalesce rapid redraw requests into one draw
+        self._draw_timer = None
+        self._pending_draw = False
+
+        # Console batching: messages are buffered and flushed to the
+        # sidebar from a single-shot timer, so a burst of log lines costs
+        # one text-artist update instead of one per line
+        self._defer_console = False
+        self._console_buffer: List[str] = []
+        self._console_timer = None
+        self._pending_console_flush = False
+
+        # Controller version already rendered; no-op clicks skip the redraw
+        self._last_rendered_version: Optional[int] = None
+
+    DRAW_DEBOUNCE_MS = 50
+    CONSOLE_FLUSH_MS = 50
+    CONSOLE_BUFFER_LIMIT = 500
+
+    def _schedule_draw(self) -> None:
+        """
+        Request a canvas redraw, coalescing requests within a short window.
+
+        Rapid button clicks (or the Solve-All loop) otherwise trigger one
+        full rasterization per handler; debouncing collapses them into a
+        single draw per window.
+        """
+        fig = self.visualizer._fig
+        if not fig or self._pending_draw:
+            return
+
+        self._pending_draw = True
+        try:
+            timer = fig.canvas.new_timer(interval=self.DRAW_DEBOUNCE_MS)
+            timer.single_shot = True
+            timer.add_callback(self._flush_draw)
+            timer.start()
+            self._draw_timer = timer
+        except Exception:
+            # Backend without timer support: draw immediately
+            self._flush_draw()
+
+    def _flush_draw(self) -> None:
+        """Perform the deferred draw."""
+        self._pending_draw = False
+        self._draw_timer = None
+        if self.visualizer._fig:
+            self.visualizer._fig.canvas.draw_idle()
     
     def _on_console_output(self, text: str) -> None:
         """Callback for console output to display in sidebar."""
+        self._console_buffer.append(text)
+        # Bound memory: drop oldest entries beyond the cap
+        if len(self._console_buffer) > self.CONSOLE_BUFFER_LIMIT:
+            del self._console_buffer[:-self.CONSOLE_BUFFER_LIMIT]
+        if not self._defer_console:
+            self._schedule_console_flush()
+
+    def _schedule_console_flush(self) -> None:
+        """Arm a single-shot timer that drains the console buffer."""
+        fig = self.visualizer._fig
+        if not fig or self._pending_console_flush:
+            return
+
+        self._pending_console_flush = True
+        try:
+            timer = fig.canvas.new_timer(interval=self.CONSOLE_FLUSH_MS)
+            timer.single_shot = True
+            timer.add_callback(self._flush_console)
+            timer.start()
+            self._console_timer = timer
+        except Exception:
+            # Backend without timer support: flush immediately
+            self._flush_console()
+
+    def _flush_console(self) -> None:
+        """Push the buffered console output to the sidebar in one update."""
+        self._pending_console_flush = False
+        self._console_timer = None
+        if not self._console_buffer:
+            return
+        # The sidebar log replaces the previous message, so only the most
+        # recent entry needs to reach it
+        message = self._console_buffer[-1]
+        self._console_buffer.clear()
         if self.visualizer._sidebar_renderer:
-            self.visualizer._sidebar_renderer.add_console_message(text)
+            self.visualizer._sidebar_renderer.add_console_message(message)
+
+    @contextmanager
+    def _batch_updates(self):
+        """
+        Suppress per-step sidebar updates inside the block.
+
+        Console messages are buffered and only the final one is pushed to
+        the sidebar on exit (it replaces previous messages anyway), so a
+        Solve-All run costs one sidebar update instead of one per step.
+        """
+        self._defer_console = True
+        try:
+            yield
+        finally:
+            self._defer_console = False
+            self._flush_console()
+            self._schedule_draw()
     
     def setup_and_run(self) -> None:
         """Main entry point: setup layout and run interactive session."""
@@ -83,13 +204,10 @@ class InteractiveSession:
         # Print instructions
         self.logger.log_instructions()
         
-        # Update window title
+        # Update window title (the _quick_redraw above already ended with
+        # draw_idle, so no extra draw is scheduled here)
         self.visualizer.set_window_title("Transport Problem Solver - Interactive Mode")
-        
-        # Redraw the canvas
-        if self.visualizer._fig:
-            self.visualizer._fig.canvas.draw_idle()
-    
+
     def _setup_solver_session(self) -> None:
         """Setup interactive solver session with buttons."""
         # Render initial view
@@ -105,37 +223,42 @@ class InteractiveSession:
         self.visualizer.set_window_title("Transport Problem Solver - Interactive Mode")
     
     def _create_navigation_buttons(self) -> None:
-        """Create interactive navigation buttons."""
-        button_height = 0.04
-        button_width = 0.12
-        button_y = 0.01
-        spacing = 0.02
-        
+        """Create interactive navigation buttons (axes allocated once per figure)."""
+        fig = self.visualizer._fig
+        if fig is None:
+            return
+
+        # Buttons already exist: just refresh their states instead of
+        # allocating new axes and triggering a figure relayout
+        if self._btn_prev is not None:
+            self._update_button_states()
+            return
+
         # Previous button
-        ax_prev = plt.axes([0.1, button_y, button_width, button_height])
+        ax_prev = fig.add_axes(_BUTTON_RECTS[0])
         self._btn_prev = Button(ax_prev, '< Prev', color='lightgray', hovercolor='gray')
         self._btn_prev.on_clicked(self._on_prev_click)
-        
+
         # Next button
-        ax_next = plt.axes([0.1 + button_width + spacing, button_y, button_width, button_height])
+        ax_next = fig.add_axes(_BUTTON_RECTS[1])
         self._btn_next = Button(ax_next, 'Next >', color='lightblue', hovercolor='blue')
         self._btn_next.on_clicked(self._on_next_click)
-        
+
         # Solve All button
-        ax_solve = plt.axes([0.1 + 2*(button_width + spacing), button_y, button_width, button_height])
+        ax_solve = fig.add_axes(_BUTTON_RECTS[2])
         self._btn_solve_all = Button(ax_solve, 'Solve All', color='lightgreen', hovercolor='green')
         self._btn_solve_all.on_clicked(self._on_solve_all_click)
-        
+
         # Reset button
-        ax_reset = plt.axes([0.1 + 3*(button_width + spacing), button_y, button_width, button_height])
+        ax_reset = fig.add_axes(_BUTTON_RECTS[3])
         self._btn_reset = Button(ax_reset, 'Reset', color='lightyellow', hovercolor='yellow')
         self._btn_reset.on_clicked(self._on_reset_click)
-        
+
         if self.show_console_in_sidebar:
-            ax_console = plt.axes([0.1 + 4*(button_width + spacing), button_y, button_width, button_height])
+            ax_console = fig.add_axes(_BUTTON_RECTS[4])
             self._btn_toggle_console = Button(ax_console, 'Console', color='#FFE4B5', hovercolor='#FFD700')
             self._btn_toggle_console.on_clicked(self._on_toggle_console_click)
-        
+
         self._update_button_states()
     
     def _update_button_states(self) -> None:
@@ -157,11 +280,50 @@ class InteractiveSession:
         self._btn_solve_all.ax.set_facecolor(
             'lightgreen' if self.controller.can_go_next() else '#E0E0E0'
         )
-        
-        # Trigger redraw
+
+        # Trigger redraw (blit just the button strip when possible)
         if self.visualizer.is_ready():
-            plt.gcf().canvas.draw_idle()
-    
+            if not self._blit_buttons():
+                self._schedule_draw()
+
+    def _blit_buttons(self) -> bool:
+        """
+        Redraw only the button axes via blitting.
+
+        A facecolor change affects four tiny rectangles; a full canvas
+        draw re-renders every graph artist for nothing.
+
+        Returns:
+            True if the partial redraw was performed, False if a full
+            draw is needed instead.
+        """
+        fig = self.visualizer._fig
+        canvas = fig.canvas if fig else None
+        if canvas is None or not canvas.supports_blit:
+            return False
+        # Nothing rasterized yet: blitting has no background to reuse
+        if getattr(canvas, 'renderer', None) is None:
+            return False
+
+        buttons = (
+            self._btn_prev, self._btn_next, self._btn_solve_all,
+            self._btn_reset, self._btn_toggle_console
+        )
+        try:
+            for button in buttons:
+                if button is None:
+                    continue
+                ax = button.ax
+                ax.draw_artist(ax.patch)
+                for spine in ax.spines.values():
+                    ax.draw_artist(spine)
+                for text in ax.texts:
+                    ax.draw_artist(text)
+                canvas.blit(ax.bbox)
+            return True
+        except Exception:
+            return False
+
     def _on_prev_click(self, event) -> None:
         """Handle Previous button click."""
         self.controller.prev_step()
@@ -204,18 +366,23 @@ class InteractiveSession:
             return
         
         self.logger.log_solve_all_start()
-        
+
         initial_step = self.controller.current_step
-        
-        while self.controller.can_go_next():
-            self.controller.next_step()
-            state = self.controller.get_current_state()
-            if state:
-                self.logger.log_step(state, self.controller.current_step + 1)
-            
-            if self.controller.is_solved():
-                break
-        
+
+        with self._batch_updates():
+            while self.controller.can_go_next():
+                self.controller.next_step()
+                state = self.controller.get_current_state()
+                if state:
+                    # Queue only; formatting is string-heavy and would
+                    # dominate the solve loop's latency
+                    self.logger.log_step_deferred(state, self.controller.current_step + 1)
+
+                if self.controller.is_solved():
+                    break
+
+            self.logger.flush_deferred()
+
         total_steps = self.controller.current_step - initial_step
         self.logger.log_solve_all_complete(total_steps)
         
@@ -224,10 +391,13 @@ class InteractiveSession:
     
     def _on_reset_click(self, event) -> None:
         """Handle Reset button click."""
+        from .view_models import clear_view_model_caches
+
         self.logger.log_reset()
-        
-        # Reset controller
+
+        # Reset controller and drop ViewModels memoized against old states
         self.controller.reset()
+        clear_view_model_caches()
         
         # Reset visualization to initial state (no solution)
         self.visualizer.apply_solution_state(None)
@@ -255,14 +425,19 @@ class InteractiveSession:
             
             # Trigger redraw
             if self.visualizer.is_ready():
-                plt.gcf().canvas.draw_idle()
+                self._schedule_draw()
     
     def _show_current_state(self) -> None:
         """Show the current solver state visually."""
+        version = self.controller.get_current_version()
+        if version == self._last_rendered_version:
+            return
+        self._last_rendered_version = version
+
         state = self.controller.get_current_state()
         if not state:
             return
-        
+
         # Update visualization
         self.visualizer.apply_solution_state(state)
         
@@ -273,15 +448,7 @@ class InteractiveSession:
         title = f"Step {step_num}/{total_steps}: {step_name}"
         self.visualizer.set_window_title(title)
     
-    def _get_step_name(self, step_type: StepType) -> str:
+    @staticmethod
+    def _get_step_name(step_type: StepType) -> str:
         """Get human-readable step name."""
-        names = {
-            StepType.INITIAL_BASIS: "Initial Basis",
-            StepType.CALCULATE_POTENTIALS: "Calculate Potentials",
-            StepType.CHECK_OPTIMALITY: "Check Optimality",
-            StepType.FIND_CYCLE: "Find Cycle",
-            StepType.CALCULATE_THETA: "Calculate θ",
-            StepType.UPDATE_FLOWS: "Update Flows",
-            StepType.OPTIMAL: "Optimal Solution"
-        }
-        return names.get(step_type, step_type.value)
+        return _STEP_NAMES.get(step_type, step_type.value)
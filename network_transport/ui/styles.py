@@ -2,12 +2,13 @@ from abc import ABC
 from dataclasses import dataclass
 from typing import Dict
 
-@dataclass
 class BaseStyle(ABC):
-    pass
+    # No fields of its own; empty slots keep the frozen slotted
+    # subclasses free of a per-instance __dict__
+    __slots__ = ()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NodeStyle(BaseStyle):
     """Node visual properties."""
     radius: float = 0.5
@@ -21,7 +22,7 @@ class NodeStyle(BaseStyle):
     potential_label_offset: float = 0.8
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EdgeStyle(BaseStyle):
     """Edge visual properties."""
     label_font_size: int = 8
@@ -32,7 +33,7 @@ class EdgeStyle(BaseStyle):
     violation_color: str = 'red'
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SupplyDemandStyle(BaseStyle):
     """Supply/demand arrow properties."""
     arrow_length: float = 1.5
@@ -44,7 +45,7 @@ class SupplyDemandStyle(BaseStyle):
     label_font_size: int = 9
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LayoutStyle(BaseStyle):
     """Layout configuration."""
     figure_width: float = 16
@@ -70,34 +71,82 @@ class VisualStyle(BaseStyle):
             'sink': 'lightcoral',
             'transit': 'lightblue'
         }
-    
-    def get_node_color(self, node_type: str) -> str:
-        """Get color for node type."""
-        return self._node_colors.get(node_type, 'lightgray')
-    
-    def get_edge_style_params(self, is_basis: bool, violates_optimality: bool) -> Dict[str, any]:
-        """Get matplotlib style parameters for edge."""
-        if violates_optimality:
-            return {
+
+        # Prebuilt kwarg dicts for text/arrow creation: the renderers pass
+        # these by reference instead of re-reading style attributes and
+        # assembling small dicts per artist
+        self.node_label_kwargs: Dict[str, any] = dict(
+            fontsize=self.node.label_font_size,
+            fontweight=self.node.label_font_weight,
+            color=self.node.label_color
+        )
+        self.potential_label_kwargs: Dict[str, any] = dict(
+            fontsize=self.node.potential_font_size,
+            fontweight='normal',
+            color=self.node.potential_color
+        )
+        self.edge_label_kwargs: Dict[str, any] = dict(
+            fontsize=self.edge.label_font_size
+        )
+        self.supply_arrow_kwargs: Dict[str, any] = dict(
+            head_width=self.supply_demand.arrow_head_width,
+            head_length=self.supply_demand.arrow_head_length,
+            fc=self.supply_demand.supply_color,
+            ec=self.supply_demand.supply_color,
+            linewidth=self.supply_demand.arrow_line_width
+        )
+        self.demand_arrow_kwargs: Dict[str, any] = dict(
+            head_width=self.supply_demand.arrow_head_width,
+            head_length=self.supply_demand.arrow_head_length,
+            fc=self.supply_demand.demand_color,
+            ec=self.supply_demand.demand_color,
+            linewidth=self.supply_demand.arrow_line_width
+        )
+        self.supply_label_kwargs: Dict[str, any] = dict(
+            fontsize=self.supply_demand.label_font_size,
+            fontweight='bold',
+            color=self.supply_demand.supply_color
+        )
+        self.demand_label_kwargs: Dict[str, any] = dict(
+            fontsize=self.supply_demand.label_font_size,
+            fontweight='bold',
+            color=self.supply_demand.demand_color
+        )
+
+        # Only three edge styles exist; build them once and hand out
+        # shared references (callers treat them as read-only)
+        self._edge_style_cache: Dict[str, Dict[str, any]] = {
+            'violation': {
                 'arrowstyle': '->',
                 'color': self.edge.violation_color,
                 'linewidth': self.edge.basis_linewidth,
                 'linestyle': 'solid',
                 'mutation_scale': 20
-            }
-        elif is_basis:
-            return {
+            },
+            'basis': {
                 'arrowstyle': '->',
                 'color': self.edge.basis_color,
                 'linewidth': self.edge.basis_linewidth,
                 'linestyle': 'solid',
                 'mutation_scale': 20
-            }
-        else:
-            return {
+            },
+            'nonbasis': {
                 'arrowstyle': '->',
                 'color': self.edge.non_basis_color,
                 'linewidth': self.edge.non_basis_linewidth,
                 'linestyle': 'dashed',
                 'mutation_scale': 15
             }
+        }
+
+    def get_node_color(self, node_type: str) -> str:
+        """Get color for node type."""
+        return self._node_colors.get(node_type, 'lightgray')
+
+    def get_edge_style_params(self, is_basis: bool, violates_optimality: bool) -> Dict[str, any]:
+        """Get matplotlib style parameters for edge."""
+        if violates_optimality:
+            return self._edge_style_cache['violation']
+        elif is_basis:
+            return self._edge_style_cache['basis']
+        return self._edge_style_cache['nonbasis']
@@ -1,159 +1,202 @@
 from typing import Optional
 
-from network_transport.solver.utils import StepType
 from ..models.node import Node
 from ..models.edge import Edge, EPSILON
-from ..solver.transport_solver import SolutionState
+from ..solver.utils import SolutionState, StepType
+
+
+# Hash-consing caches keyed by (model id, state identity). Solver states are
+# created once per step and retained in the controller history, so identity
+# is a stable key until the history is discarded.
+_node_vm_cache: dict = {}
+_edge_vm_cache: dict = {}
+
+
+def clear_view_model_caches() -> None:
+    """Drop memoized ViewModels (call when solver history is discarded)."""
+    _node_vm_cache.clear()
+    _edge_vm_cache.clear()
 
 
 class NodeViewModel:
+    __slots__ = ('_node', '_state', '_potential')
+
+    @classmethod
+    def get(cls, node: Node, state: Optional[SolutionState] = None) -> 'NodeViewModel':
+        """Return a shared ViewModel for this (node, state) pair."""
+        key = (node.id, id(state))
+        vm = _node_vm_cache.get(key)
+        if vm is None or vm._node is not node or vm._state is not state:
+            vm = cls(node, state)
+            _node_vm_cache[key] = vm
+        return vm
+
     def __init__(self, node: Node, state: Optional[SolutionState] = None):
         """
         Create ViewModel wrapping a node with optional solution state.
-        
+
         Args:
             node: Node model (problem data)
             state: Optional SolutionState (dynamic solver state)
         """
         self._node = node
         self._state = state
-    
+
+        # Resolve state-derived values once; properties become plain reads
+        state_valid = state is not None and state.step_type != StepType.INITIAL_STATE
+        if state_valid and state.potentials:
+            self._potential = state.potentials.get(node.id)
+        else:
+            self._potential = None
+
     @property
     def id(self) -> str:
         return self._node.id
-    
+
     @property
     def balance(self) -> float:
         return self._node.balance
-    
+
     @property
     def node_type(self):
         return self._node.node_type
-    
+
     @property
     def potential(self) -> Optional[float]:
-        if self._state and \
-            self._state.step_type != StepType.INITIAL_STATE and \
-            self._state.potentials and \
-            self._node.id in self._state.potentials:
+        return self._potential
 
-            assert self._state.potentials is not None
-            return self._state.potentials[self._node.id]
-        return None
-    
     def __repr__(self) -> str:
         return f"NodeViewModel({self._node.id}, balance={self.balance}, potential={self.potential})"
-    
+
     def __str__(self) -> str:
         return f"Node {self.id} [{self.node_type.value}]: b={self.balance}, u={self.potential}"
 
 
 class EdgeViewModel:
+    __slots__ = (
+        '_edge', '_state', '_edge_id', '_state_valid',
+        '_flow', '_is_basis', '_delta', '_violation'
+    )
+
+    @classmethod
+    def get(cls, edge: Edge, state: Optional[SolutionState] = None) -> 'EdgeViewModel':
+        """Return a shared ViewModel for this (edge, state) pair."""
+        key = (edge.edge_id, id(state))
+        vm = _edge_vm_cache.get(key)
+        if vm is None or vm._edge is not edge or vm._state is not state:
+            vm = cls(edge, state)
+            _edge_vm_cache[key] = vm
+        return vm
+
     def __init__(self, edge: Edge, state: Optional[SolutionState] = None):
         """
         Create ViewModel wrapping an edge with optional solution state.
-        
+
         Args:
             edge: Immutable Edge model (problem data)
             state: Optional SolutionState (dynamic solver state)
         """
         self._edge = edge
         self._state = state
-    
+        self._edge_id = edge.edge_id
+
+        # Resolve state-derived values once per instance instead of
+        # re-walking the state/dict chain on every property access
+        self._state_valid = bool(
+            state is not None and state.step_type != StepType.INITIAL_STATE
+        )
+        if self._state_valid:
+            edge_id = self._edge_id
+            self._flow = state.flows.get(edge_id, 0.0) if state.flows else 0.0
+            self._is_basis = (
+                state.basis_edges is not None and edge_id in state.basis_edges
+            )
+            self._delta = state.deltas.get(edge_id) if state.deltas else None
+        else:
+            self._flow = 0.0
+            self._is_basis = False
+            self._delta = None
+
+        # Instances are hash-consed per (edge, state), so resolving the
+        # violation here means it is computed exactly once per state and
+        # every later query is a lookup
+        self._violation = self._compute_violation()
+
     @property
     def from_node(self) -> str:
         return self._edge.from_node
-    
+
     @property
     def to_node(self) -> str:
         return self._edge.to_node
-    
+
     @property
     def cost(self) -> float:
         return self._edge.cost
-    
+
     @property
     def capacity(self) -> float:
         return self._edge.capacity
-    
+
     @property
     def edge_id(self) -> tuple[str, str]:
-        return self._edge.edge_id
-    
+        return self._edge_id
+
     @property
     def flow(self) -> float:
-        if self._state and \
-            self._state.step_type != StepType.INITIAL_STATE and \
-            self._state.flows and \
-            self._edge.edge_id in self._state.flows:
+        return self._flow
 
-            return self._state.flows[self._edge.edge_id]
-        return 0.0
-    
     @property
     def is_basis(self) -> bool:
-        if self._state and self._state.step_type != StepType.INITIAL_STATE:
-            assert self._state.basis_edges is not None
-            return self._edge.edge_id in self._state.basis_edges
-        return False
-    
+        return self._is_basis
+
     @property
     def delta(self) -> Optional[float]:
-        if self._state and \
-            self._state.step_type != StepType.INITIAL_STATE and \
-            self._state.deltas and \
-            self._edge.edge_id in self._state.deltas:
-            
-            assert self._state.deltas is not None
-            return self._state.deltas[self._edge.edge_id]
-        return None
-    
+        return self._delta
+
     @property
     def is_saturated(self) -> bool:
-        return self.flow >= self.capacity - EPSILON
-    
+        return self._flow >= self.capacity - EPSILON
+
     @property
     def is_empty(self) -> bool:
-        return self.flow <= EPSILON
-    
+        return self._flow <= EPSILON
+
     @property
     def residual_capacity(self) -> float:
-        return self.capacity - self.flow
-    
+        return self.capacity - self._flow
+
     @property
     def cycle_sign(self) -> Optional[str]:
-        if self._state and self._state.step_type != StepType.INITIAL_STATE and self._state.cycle:
+        if self._state_valid and self._state.cycle:
             for cycle_edge in self._state.cycle:
-                if cycle_edge.edge.edge_id == self._edge.edge_id:
+                if cycle_edge.edge.edge_id == self._edge_id:
                     return cycle_edge.sign
         return None
-    
-    def violates_optimality(self) -> bool:
-        if self.is_basis or self.delta is None:
-            return False
-        
-        if self.is_empty:
-            return self.delta > EPSILON
-        elif self.is_saturated:
-            return self.delta < -EPSILON
-        
-        return False
-    
-    def get_optimality_violation(self) -> Optional[tuple[float, str]]:
-        if self.is_basis or self.delta is None:
+
+    def _compute_violation(self) -> Optional[tuple[float, str]]:
+        """Single source for both optimality checks (cached fields only)."""
+        delta = self._delta
+        if self._is_basis or delta is None:
             return None
-        
-        if self.is_empty and self.delta > EPSILON:
-            return (self.delta, "increase")
-        elif self.is_saturated and self.delta < -EPSILON:
-            return (abs(self.delta), "decrease")
-        
+
+        flow = self._flow
+        if delta > EPSILON and flow <= EPSILON:
+            return (delta, "increase")
+        if delta < -EPSILON and flow >= self._edge.capacity - EPSILON:
+            return (-delta, "decrease")
         return None
-    
+
+    def violates_optimality(self) -> bool:
+        return self._violation is not None
+
+    def get_optimality_violation(self) -> Optional[tuple[float, str]]:
+        return self._violation
+
     def __repr__(self) -> str:
         basis = "basis" if self.is_basis else "non-basis"
         return f"EdgeViewModel({self.from_node}->{self.to_node}, c={self.cost}, x={self.flow}/{self.capacity}, {basis})"
-    
+
     def __str__(self) -> str:
         basis = "[B]" if self.is_basis else "[NB]"
         delta_str = f", Δ={self.delta:.2f}" if self.delta is not None else ""
@@ -1,10 +1,15 @@
+import pickle
+
 import matplotlib.pyplot as plt
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple
 
 from network_transport.solver.utils import SolutionState
 
 from ..models.graph import Graph
+from ._fastmath import autoscale_bounds
+from .geometry import calculate_label_position
 from .layout_context import LayoutContext
 from .styles import VisualStyle
 from .renderers import LegendRenderer, SidebarRenderer
@@ -48,10 +53,37 @@ class GraphVisualizer:
         # Interaction state
         self._interaction_handler = None
         self._interactive_mode = False
-        
+        self._in_redraw = False
+
+        # Drag blitting state: cached static background plus the artists
+        # that move with the current drag target
+        self._drag_background = None
+        self._drag_artists: list = []
+        self._drag_edges: list = []
+        self._drag_edge_ids: list = []
+
+        # Motion redraw coalescing: at most one full redraw in flight
+        self._redraw_pending = False
+        self._motion_timer = None
+
+        # Cached empty main-axes region for artist-only blit redraws
+        self._axes_background = None
+
         # Current solution state (for ViewModels)
         self._current_state: Optional[SolutionState] = None
-    
+
+        # ViewModel dicts cached per state (rebuilt only on state change)
+        self._node_vms = None
+        self._edge_vms = None
+        self._vm_cache_state_id = None
+
+        # Single worker that writes figure snapshots to disk off the UI loop
+        self._save_executor: Optional[ThreadPoolExecutor] = None
+
+    # Frame budget for motion-driven full redraws (~30 FPS)
+    MOTION_REDRAW_INTERVAL_MS = 33
+
+
     def set_window_title(self, title: str) -> None:
         """
         Set window title.
@@ -126,6 +158,10 @@ class GraphVisualizer:
             state: Solution state from solver, or None to reset to initial state
         """
         self._current_state = state
+        self._vm_cache_state_id = None
+        # Static artists change with the state; a cached drag background
+        # captured against the old state would paint stale labels
+        self._end_drag_blit()
         self._trigger_redraw()
     
     def redraw(self) -> None:
@@ -164,12 +200,15 @@ class GraphVisualizer:
     
     def _print_setup_instructions(self) -> None:
         """Print instructions for interactive setup."""
-        print("[SETUP] Interactive Setup Mode")
-        print("=" * 50)
-        print("• Drag nodes to reposition them")
-        print("• Drag edge labels to reposition them")
-        print("• Click 'Done' button when ready")
-        print("=" * 50)
+        # One write/flush instead of six line-buffered print calls
+        print(
+            "[SETUP] Interactive Setup Mode\n"
+            + "=" * 50 + "\n"
+            "• Drag nodes to reposition them\n"
+            "• Drag edge labels to reposition them\n"
+            "• Click 'Done' button when ready\n"
+            + "=" * 50
+        )
     
     def _add_done_button(self, callback) -> None:
         """Add 'Done' button to finalize layout setup."""
@@ -178,8 +217,9 @@ class GraphVisualizer:
         if not self._fig:
             return
         
-        # Create button at bottom center
-        ax_done = plt.axes([0.45, 0.02, 0.1, 0.04])
+        # Create button at bottom center (add_axes targets this figure
+        # directly without going through the pyplot figure manager)
+        ax_done = self._fig.add_axes([0.45, 0.02, 0.1, 0.04])
         self._done_button = Button(ax_done, 'Done', color='lightgreen', hovercolor='green')
         self._done_button.on_clicked(callback)
     
@@ -197,12 +237,19 @@ class GraphVisualizer:
         if not nodes_without_positions:
             return
         
+        # Batched trig over all missing nodes at once (scalar np.cos/np.sin
+        # per node pays full dispatch overhead for nothing)
         radius = 5.0
-        for i, node in nodes_without_positions:
-            angle = 2 * np.pi * i / len(self.graph.nodes)
-            x = radius * np.cos(angle)
-            y = radius * np.sin(angle)
-            self.layout.set_node_position(node.id, x, y)
+        idx = np.fromiter(
+            (i for i, _ in nodes_without_positions),
+            dtype=np.int64, count=len(nodes_without_positions)
+        )
+        angles = 2 * np.pi * idx / len(self.graph.nodes)
+        xs = radius * np.cos(angles)
+        ys = radius * np.sin(angles)
+        self.layout.set_node_positions_bulk(
+            [node.id for _, node in nodes_without_positions], xs, ys
+        )
     
     def _ensure_layout_ready(self) -> None:
         """Ensure layout is ready for rendering."""
@@ -219,6 +266,7 @@ class GraphVisualizer:
         self._draw_all_elements()
         self._auto_scale()
         self._set_background_color()
+        self._connect_viewport_callbacks()
     
     def _create_figure(self) -> None:
         """Create matplotlib figure."""
@@ -286,26 +334,39 @@ class GraphVisualizer:
             self.graph, self.layout, self._node_renderer, self._edge_renderer
         )
     
+    def _get_view_models(self) -> Tuple[dict, dict]:
+        """
+        Get ViewModel dicts for the current state, cached by state identity.
+
+        Rebuilding the dicts costs O(V+E) allocations per frame; the
+        contents only change when a new solution state is applied, so
+        redraws of the same state reuse the previous dicts.
+        """
+        state_id = id(self._current_state)
+        if state_id != self._vm_cache_state_id:
+            from .view_models import NodeViewModel, EdgeViewModel
+
+            # ViewModel instances are hash-consed per (model, state)
+            self._node_vms = {
+                node_id: NodeViewModel.get(node, self._current_state)
+                for node_id, node in self.graph.nodes.items()
+            }
+            self._edge_vms = {
+                edge_id: EdgeViewModel.get(edge, self._current_state)
+                for edge_id, edge in self.graph.edges.items()
+            }
+            self._vm_cache_state_id = state_id
+        return self._node_vms, self._edge_vms
+
     def _draw_all_elements(self) -> None:
         """
         Draw all visual elements.
-        
+
         Creates node and edge view models to provide unified access
         to both static problem data and dynamic solution state.
         """
-        from .view_models import NodeViewModel, EdgeViewModel
-        
-        # Create ViewModels wrapping models with current state
-        node_vms = {
-            node_id: NodeViewModel(node, self._current_state)
-            for node_id, node in self.graph.nodes.items()
-        }
-        
-        edge_vms = {
-            edge_id: EdgeViewModel(edge, self._current_state)
-            for edge_id, edge in self.graph.edges.items()
-        }
-        
+        node_vms, edge_vms = self._get_view_models()
+
         # Pass ViewModels to renderers
         self._supply_demand_renderer.draw_supply_demand_arrows()
         self._edge_renderer.draw_all_edges(edge_vms)
@@ -319,111 +380,333 @@ class GraphVisualizer:
     
     def _auto_scale(self) -> None:
         """Automatically scale axes to fit content."""
-        positions = [
-            self.layout.get_node_position(node.id)
-            for node in self.graph.nodes.values()
-            if self.layout.has_position(node.id)
-        ]
-        
-        if not positions:
+        positions = self.layout.positions_array()
+        if positions.size == 0:
             return
-        
-        xs = [pos[0] for pos in positions]
-        ys = [pos[1] for pos in positions]
-        
+
         padding = 2.0 if self._interactive_mode else self.style.layout.padding
         extra = self.style.supply_demand.arrow_length + 1.0
-        
-        x_min, x_max = min(xs) - padding, max(xs) + padding
-        y_min, y_max = min(ys) - padding - extra, max(ys) + padding + extra
-        
-        # Ensure minimum size
-        x_min, x_max = self._ensure_minimum_range(x_min, x_max, 10)
-        y_min, y_max = self._ensure_minimum_range(y_min, y_max, 10)
-        
+
+        x_min, x_max, y_min, y_max = autoscale_bounds(
+            positions, padding, extra, 10.0
+        )
+
         self._ax_main.set_xlim(x_min, x_max)
         self._ax_main.set_ylim(y_min, y_max)
-    
-    def _ensure_minimum_range(
-        self, min_val: float, max_val: float, min_size: float
-    ) -> Tuple[float, float]:
-        """Ensure axis range is at least min_size."""
-        if max_val - min_val < min_size:
-            center = (min_val + max_val) / 2
-            return (center - min_size / 2, center + min_size / 2)
-        return (min_val, max_val)
-    
+
+    def _connect_viewport_callbacks(self) -> None:
+        """Repopulate culled edges when the user pans or zooms."""
+        if self._ax_main is None:
+            return
+        self._ax_main.callbacks.connect('xlim_changed', self._on_viewport_change)
+        self._ax_main.callbacks.connect('ylim_changed', self._on_viewport_change)
+
+    def _on_viewport_change(self, ax) -> None:
+        """Handle axis limit changes from pan/zoom."""
+        if not self._in_redraw:
+            self._quick_redraw()
+
     def _connect_interaction_handlers(self) -> None:
         """Connect mouse event handlers for interaction."""
         self._fig.canvas.mpl_connect('button_press_event', self._on_press)
         self._fig.canvas.mpl_connect('button_release_event', self._on_release)
         self._fig.canvas.mpl_connect('motion_notify_event', self._on_motion)
-    
+        self._fig.canvas.mpl_connect('resize_event', self._on_resize)
+
     def _on_press(self, event) -> None:
         """Handle mouse press event."""
         if self._interactive_mode:
             self._interaction_handler.handle_press(event, self._ax_main)
-    
+            self._begin_drag_blit()
+
     def _on_release(self, event) -> None:
         """Handle mouse release event."""
         if self._interactive_mode:
+            was_blitting = self._end_drag_blit()
             self._interaction_handler.handle_release(event)
-    
+            # Rebuild all artists once so the final positions are canonical
+            if was_blitting:
+                self._quick_redraw()
+
     def _on_motion(self, event) -> None:
         """Handle mouse motion event."""
         if self._interactive_mode:
             if self._interaction_handler.handle_motion(event, self._ax_main):
-                self._quick_redraw()
+                if self._drag_background is not None:
+                    self._update_drag_artists()
+                    self._blit_drag()
+                else:
+                    self._request_motion_redraw()
+
+    def _request_motion_redraw(self) -> None:
+        """
+        Coalesce motion-driven full redraws into one per frame budget.
+
+        Fast mice emit 100+ motion events per second; without coalescing
+        each one queues a clear-and-rebuild behind the event loop. A
+        single pending timer collapses a burst into one redraw.
+        """
+        if self._redraw_pending:
+            return
+
+        self._redraw_pending = True
+        try:
+            timer = self._fig.canvas.new_timer(interval=self.MOTION_REDRAW_INTERVAL_MS)
+            timer.single_shot = True
+            timer.add_callback(self._flush_motion_redraw)
+            timer.start()
+            self._motion_timer = timer
+        except Exception:
+            # Backend without timer support: redraw immediately
+            self._flush_motion_redraw()
+
+    def _flush_motion_redraw(self) -> None:
+        """Perform the deferred motion redraw."""
+        self._redraw_pending = False
+        self._motion_timer = None
+        self._quick_redraw()
+
+    def _on_resize(self, event) -> None:
+        """Figure resize invalidates any cached blit backgrounds."""
+        self._end_drag_blit()
+        self._axes_background = None
+
+    def _begin_drag_blit(self) -> None:
+        """
+        Capture the static background when a drag starts.
+
+        The dragged artists are marked animated (excluded from normal
+        draws); one full draw then caches every other pixel, so motion
+        events only restore the cached region and redraw the movers
+        instead of clearing and rebuilding the whole axes.
+        """
+        handler = self._interaction_handler
+        if handler is None or not (handler.dragging_node or handler.dragging_label):
+            return
+
+        canvas = self._fig.canvas
+        if not canvas.supports_blit:
+            return
+
+        self._drag_artists = self._collect_drag_artists()
+        if not self._drag_artists:
+            return
+
+        for artist in self._drag_artists:
+            artist.set_animated(True)
+        canvas.draw()
+        self._drag_background = canvas.copy_from_bbox(self._ax_main.bbox)
+
+    def _collect_drag_artists(self) -> list:
+        """Collect the artists that move with the current drag target."""
+        handler = self._interaction_handler
+        artists = []
+        self._drag_edges = []
+        self._drag_edge_ids = []
+
+        if handler.dragging_label:
+            label = self._edge_renderer.edge_labels.get(handler.dragging_label)
+            if label is not None:
+                self._drag_edges.append((handler.dragging_label, None, label))
+                artists.append(label)
+            return artists
+
+        node_id = handler.dragging_node
+        for registry in (
+            self._node_renderer.node_artists,
+            self._node_renderer.node_labels,
+            self._node_renderer.potential_labels,
+            self._supply_demand_renderer.arrow_artists,
+            self._supply_demand_renderer.balance_labels,
+        ):
+            artist = registry.get(node_id)
+            if artist is not None:
+                artists.append(artist)
+
+        # Edges incident to the dragged node move with it, labels included.
+        # Their lines live in the shared collections, so the collections
+        # themselves join the blit set
+        self._drag_edge_ids = [
+            edge_id for edge_id in self._edge_renderer.edge_index
+            if node_id in edge_id
+        ]
+        if self._drag_edge_ids:
+            if self._edge_renderer.edge_collection is not None:
+                artists.append(self._edge_renderer.edge_collection)
+            if self._edge_renderer.head_collection is not None:
+                artists.append(self._edge_renderer.head_collection)
+            for edge_id in self._drag_edge_ids:
+                label = self._edge_renderer.edge_labels.get(edge_id)
+                if label is not None:
+                    self._drag_edges.append((edge_id, None, label))
+                    artists.append(label)
+        return artists
+
+    def _update_drag_artists(self) -> None:
+        """Move the dragged artists to their new layout positions in place."""
+        handler = self._interaction_handler
+        node_id = handler.dragging_node
+
+        if node_id:
+            pos = self.layout.get_node_position(node_id)
+            if pos is None:
+                return
+            x, y = pos
+
+            circle = self._node_renderer.node_artists.get(node_id)
+            if circle is not None:
+                circle.center = (x, y)
+
+            label = self._node_renderer.node_labels.get(node_id)
+            if label is not None:
+                label.xy = (x, y)
+                label.xybox = (x, y)
+
+            potential = self._node_renderer.potential_labels.get(node_id)
+            if potential is not None:
+                offset_y = self.style.node.radius + self.style.node.potential_label_offset
+                potential.xy = (x, y + offset_y)
+                potential.xybox = (x, y + offset_y)
+
+            self._supply_demand_renderer.move_artists_for_node(node_id, (x, y))
+
+        if self._drag_edge_ids:
+            self._edge_renderer.update_edge_positions(self._drag_edge_ids)
+
+        for edge_id, arrow, label in self._drag_edges:
+            pos1 = self.layout.get_node_position(edge_id[0])
+            pos2 = self.layout.get_node_position(edge_id[1])
+            if pos1 is None or pos2 is None:
+                continue
+            if arrow is not None:
+                arrow.set_positions(pos1, pos2)
+            if label is not None:
+                visual_data = self.layout.ensure_edge_visual_data(*edge_id)
+                label.set_position(calculate_label_position(
+                    pos1, pos2,
+                    visual_data.label_position,
+                    visual_data.label_offset
+                ))
+
+    def _blit_drag(self) -> None:
+        """Restore the cached background and redraw only the moving artists."""
+        canvas = self._fig.canvas
+        canvas.restore_region(self._drag_background)
+        for artist in self._drag_artists:
+            self._ax_main.draw_artist(artist)
+        canvas.blit(self._ax_main.bbox)
+
+    def _end_drag_blit(self) -> bool:
+        """Leave blit mode; returns True if a drag blit session was active."""
+        active = self._drag_background is not None
+        for artist in self._drag_artists:
+            artist.set_animated(False)
+        self._drag_artists = []
+        self._drag_edges = []
+        self._drag_edge_ids = []
+        self._drag_background = None
+        return active
     
     def _quick_redraw(self, preserve_limits: bool = True) -> None:
         """
         Quickly redraw graph elements without recreating figure.
-        
+
+        The renderers detach and rebuild only their own artists; the axes
+        are never cleared, so spines, ticks, aspect, limits and callbacks
+        all survive between frames (ax.clear() rebuilds them each time).
+
         Args:
             preserve_limits: If True, preserve existing axis limits. If False, recalculate.
         """
-        if not self._fig:
+        if not self._fig or self._in_redraw:
             return
-        
-        from .view_models import NodeViewModel, EdgeViewModel
-        
-        # Save axis limits if needed
-        if preserve_limits:
-            xlim = self._ax_main.get_xlim()
-            ylim = self._ax_main.get_ylim()
-        
-        # Clear and redraw
-        self._ax_main.clear()
-        self._ax_main.set_aspect('equal')
-        self._ax_main.axis('off')
-        
-        # Create ViewModels
-        node_vms = {
-            node_id: NodeViewModel(node, self._current_state)
-            for node_id, node in self.graph.nodes.items()
-        }
-        
-        edge_vms = {
-            edge_id: EdgeViewModel(edge, self._current_state)
-            for edge_id, edge in self.graph.edges.items()
-        }
-        
-        self._supply_demand_renderer.draw_supply_demand_arrows()
-        self._edge_renderer.draw_all_edges(edge_vms)
-        self._node_renderer.draw_all_nodes(node_vms)
-        
-        # Restore or recalculate axis limits
-        if preserve_limits:
-            self._ax_main.set_xlim(xlim)
-            self._ax_main.set_ylim(ylim)
-        else:
-            self._auto_scale()
-        
-        # Redraw sidebar and legend
-        self._legend_renderer.draw_legend()
-        self._sidebar_renderer.draw_sidebar(self._current_state)
-        
-        self._fig.canvas.draw_idle()
+
+        self._in_redraw = True
+        try:
+            node_vms, edge_vms = self._get_view_models()
+
+            self._supply_demand_renderer.draw_supply_demand_arrows()
+            self._edge_renderer.draw_all_edges(edge_vms)
+            self._node_renderer.draw_all_nodes(node_vms)
+
+            # Recalculate axis limits if not preserved
+            if not preserve_limits:
+                self._auto_scale()
+
+            # Redraw sidebar and legend (no-ops when already clean)
+            legend_clean = self._legend_renderer._drawn
+            sidebar_clean = (
+                not self._sidebar_renderer._dirty
+                and self._current_state is self._sidebar_renderer.state
+            )
+            self._legend_renderer.draw_legend()
+            self._sidebar_renderer.draw_sidebar(self._current_state)
+
+            # If only main-axes artists changed, blit that region instead
+            # of re-rasterizing the legend and sidebar too
+            if legend_clean and sidebar_clean and self._blit_main_axes():
+                return
+
+            self._fig.canvas.draw_idle()
+        finally:
+            self._in_redraw = False
+
+    def _blit_main_axes(self) -> bool:
+        """
+        Re-rasterize only the main axes via blitting.
+
+        Restores a cached empty-axes background, draws the current graph
+        artists and blits the main bbox, skipping the legend and sidebar
+        rasterization a full canvas draw would repeat.
+
+        Returns:
+            True if the partial redraw was performed, False if a full
+            draw is needed instead.
+        """
+        canvas = self._fig.canvas
+        if not canvas.supports_blit or getattr(canvas, 'renderer', None) is None:
+            return False
+
+        try:
+            if self._axes_background is None:
+                self._capture_axes_background()
+            canvas.restore_region(self._axes_background)
+            self._ax_main.draw(canvas.renderer)
+            canvas.blit(self._ax_main.bbox)
+            return True
+        except Exception:
+            self._axes_background = None
+            return False
+
+    def _capture_axes_background(self) -> None:
+        """Cache the main-axes region with all graph artists hidden."""
+        canvas = self._fig.canvas
+        artists = self._main_axes_artists()
+        for artist in artists:
+            artist.set_visible(False)
+        try:
+            canvas.draw()
+            self._axes_background = canvas.copy_from_bbox(self._ax_main.bbox)
+        finally:
+            for artist in artists:
+                artist.set_visible(True)
+
+    def _main_axes_artists(self) -> list:
+        """All artists the graph renderers currently own on the main axes."""
+        registries = (
+            self._node_renderer.node_artists,
+            self._node_renderer.node_labels,
+            self._node_renderer.potential_labels,
+            self._edge_renderer.edge_labels,
+            self._supply_demand_renderer.arrow_artists,
+            self._supply_demand_renderer.balance_labels,
+        )
+        artists = [artist for registry in registries for artist in registry.values()]
+        if self._edge_renderer.edge_collection is not None:
+            artists.append(self._edge_renderer.edge_collection)
+        if self._edge_renderer.head_collection is not None:
+            artists.append(self._edge_renderer.head_collection)
+        return artists
     
     def _trigger_redraw(self) -> None:
         """Trigger a redraw if figure exists."""
@@ -433,7 +716,48 @@ class GraphVisualizer:
 
     
     def _save_figure(self, path: str) -> None:
-        """Save figure to file."""
-        if self._fig:
-            plt.savefig(path, dpi=300, bbox_inches='tight')
+        """
+        Save figure to file without blocking the interactive session.
+
+        The figure is snapshotted via pickle on the calling thread (cheap),
+        then rendered at 300 DPI and written to disk by a background worker
+        so the event loop keeps responding during PNG encoding.
+        """
+        if not self._fig:
+            return
+        # Detach the window manager while pickling: with it attached the
+        # snapshot records that the figure belongs to pyplot, and unpickling
+        # on the worker would spawn a GUI manager off the main thread and
+        # register a never-closed duplicate figure that steals plt.gcf()
+        manager = self._fig.canvas.manager
+        self._fig.canvas.manager = None
+        try:
+            snapshot = pickle.dumps(self._fig)
+        except Exception:
+            # Unpicklable figure state: fall back to a synchronous save
+            self._fig.savefig(path, dpi=300)
+            print(f"[SAVED] Saved to {path}")
+            return
+        finally:
+            self._fig.canvas.manager = manager
+
+        if self._save_executor is None:
+            self._save_executor = ThreadPoolExecutor(max_workers=1)
+        self._save_executor.submit(self._write_snapshot, snapshot, path)
+
+    @staticmethod
+    def _write_snapshot(snapshot: bytes, path: str) -> None:
+        """Render a pickled figure snapshot to disk (runs on the worker)."""
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        try:
+            fig = pickle.loads(snapshot)
+            canvas = FigureCanvasAgg(fig)
+            # No bbox_inches='tight': the figure geometry is laid out
+            # explicitly via add_axes, and 'tight' would force a second
+            # full render pass just to measure artist extents
+            fig.set_dpi(300)
+            canvas.print_png(path)
             print(f"[SAVED] Saved to {path}")
+        except Exception as exc:
+            print(f"[SAVED] Failed to save {path}: {exc}")
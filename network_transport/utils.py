@@ -27,18 +27,26 @@ def run_interactive_demo(
         ...     show_console_in_sidebar=True
         ... )
     """
-    print("=" * 70)
-    print(title)
-    print("=" * 70)
-    print()
-    
-    print(f"Graph: {len(graph.nodes)} nodes, {len(graph.edges)} edges")
-    total_supply = sum(n.balance for n in graph.nodes.values() if n.balance > 0)
-    total_demand = -sum(n.balance for n in graph.nodes.values() if n.balance < 0)
-    print(f"Total supply: {total_supply:.0f}")
-    print(f"Total demand: {total_demand:.0f}")
-    print()
-    
+    # Single pass over the nodes instead of two filtered traversals
+    total_supply = 0.0
+    total_demand = 0.0
+    for node in graph.nodes.values():
+        balance = node.balance
+        if balance > 0:
+            total_supply += balance
+        elif balance < 0:
+            total_demand -= balance
+
+    # Header assembled as one string and printed once
+    print(
+        "=" * 70 + "\n"
+        f"{title}\n"
+        + "=" * 70 + "\n\n"
+        f"Graph: {len(graph.nodes)} nodes, {len(graph.edges)} edges\n"
+        f"Total supply: {total_supply:.0f}\n"
+        f"Total demand: {total_demand:.0f}\n"
+    )
+
     if info_printer:
         info_printer(graph)
     
@@ -4,37 +4,16 @@ from network_transport import Graph, run_interactive_demo
 def create_railway_network() -> Graph:
     graph = Graph()
     
-    stations = [
-        ("A1", 4, "Source"),
-        ("A2", -5, "Sink"),
-        ("A3", 0, "Transit"),
-        ("A4", 7, "Source"),
-        ("A5", 4, "Source"),
-        ("A6", 0, "Transit"),
-        ("A7", -10, "Sink"),
-    ]
-    
-    for station_id, balance, _ in stations:
-        graph.add_node(station_id, balance=balance)
-    
-    routes = [
-        ("A1", "A2", 3, float("inf")),
-        ("A1", "A3", 9, float("inf")),
-        ("A2", "A5", 4, float("inf")),
-        ("A2", "A6", 10, float("inf")),
-        ("A3", "A2", 2, float("inf")),
-        ("A3", "A6", 7, float("inf")),
-        ("A4", "A1", 5, float("inf")),
-        ("A4", "A3", 4, float("inf")),
-        ("A5", "A6", 2, float("inf")),
-        ("A5", "A7", 2, float("inf")),
-        ("A6", "A4", 6, float("inf")),
-        ("A6", "A7", 6, float("inf")),
-    ]
-    
-    for from_st, to_st, cost, capacity in routes:
-        graph.add_edge(from_st, to_st, cost=cost, capacity=capacity)
-    
+    # Structure-of-arrays: parallel sequences fed to the bulk APIs
+    station_ids = ["A1", "A2", "A3", "A4", "A5", "A6", "A7"]
+    balances = [4, -5, 0, 7, 4, 0, -10]
+    graph.add_nodes_bulk(station_ids, balances)
+
+    route_from = ["A1", "A1", "A2", "A2", "A3", "A3", "A4", "A4", "A5", "A5", "A6", "A6"]
+    route_to   = ["A2", "A3", "A5", "A6", "A2", "A6", "A1", "A3", "A6", "A7", "A4", "A7"]
+    costs      = [3, 9, 4, 10, 2, 7, 5, 4, 2, 2, 6, 6]
+    graph.add_edges_bulk(route_from, route_to, costs)
+
     return graph
 
 
@@ -1,6 +1,12 @@
+import os
+import sys
+
 from network_transport import Graph, TransportSolver, SolverController
-from network_transport.solver.strategies import PhaseOneInitializer, InitializationStrategy
-from network_transport.solver.strategies.initialization import PrebuiltInitializer
+from network_transport.solver.strategies import InitializationStrategy
+from network_transport.solver.strategies.initialization import (
+    DEFAULT_PHASE_ONE_INITIALIZER,
+    PrebuiltInitializer,
+)
 from network_transport.ui import InteractiveSession, LayoutContext
 from network_transport.solver.utils import BasisResult, SolutionState
 from typing import Set, Tuple, Dict
@@ -30,9 +36,11 @@ def create_railway_network() -> Graph:
 
 
 class PhaseOneHelper:
-    
+
+    __slots__ = ('initializer',)
+
     def __init__(self):
-        self.initializer = PhaseOneInitializer()
+        self.initializer = DEFAULT_PHASE_ONE_INITIALIZER
     
     def create_auxiliary_graph(self, graph: Graph) -> Graph:
         return self.initializer._create_auxiliary_graph(graph) # pyright: ignore[reportPrivateUsage]
@@ -40,48 +48,71 @@ class PhaseOneHelper:
     def create_initial_basis(self, graph: Graph) -> Tuple[Set[Tuple[str, str]], Dict[Tuple[str, str], float]]:
         return self.initializer._setup_initial_state(graph) # pyright: ignore[reportPrivateUsage]
     
+    def build_phase1_artifacts(self, graph: Graph) -> Tuple[Graph, Set[Tuple[str, str]], Dict[Tuple[str, str], float]]:
+        return self.initializer.build_phase1_artifacts(graph)
+
     def extract_basis_for_phase2(self, original_graph: Graph, aux_final_state: SolutionState) -> BasisResult:
         return self.initializer._extract_original_solution(original_graph, aux_final_state) # pyright: ignore[reportPrivateUsage]
 
 def print_phase_header(phase_num: int, title: str) -> None:
-    print("\n" + "=" * 70)
-    print(f"PHASE {phase_num}: {title}")
-    print("=" * 70)
+    # One buffered write instead of three line-buffered print calls
+    sys.stdout.write(f"\n{'=' * 70}\nPHASE {phase_num}: {title}\n{'=' * 70}\n")
 
 
 def run_phase(
-    graph: Graph, 
+    graph: Graph,
     initialization_strategy: InitializationStrategy,
-    phase_name: str
+    phase_name: str,
+    layout: LayoutContext | None = None,
+    batch: bool = False
 ) -> SolverController:
     solver = TransportSolver(graph=graph, initialization_strategy=initialization_strategy)
     controller = SolverController(graph, solver=solver)
-    layout = LayoutContext()
-    session = InteractiveSession(graph, layout, controller)
-    
+
     print(f"\nStarting {phase_name}...")
 
+    if batch:
+        # Headless: run the solver to optimality without any UI session
+        controller.solve_all()
+        return controller
+
+    if layout is None:
+        layout = LayoutContext()
+    session = InteractiveSession(graph, layout, controller)
+
     session.setup_and_run()
     return controller
 
 
 def main() -> None:
+    # Benchmark/CI runs skip the interactive UI entirely; piped or
+    # redirected stdout means nobody is there to click, so default to the
+    # headless path there too (TRANSIT_BATCH still forces it explicitly)
+    batch = bool(os.environ.get("TRANSIT_BATCH")) or not sys.stdout.isatty()
+
     print("\n" + "=" * 70)
     print("Two-Phase - Railway Transportation Problem")
     print("=" * 70)
     
     original_graph = create_railway_network()
     helper = PhaseOneHelper()
-    
+
+    # Both phases share the same node identities, so one LayoutContext
+    # carries the node positions from Phase 1 straight into Phase 2 and
+    # skips the second interactive layout setup entirely
+    layout = LayoutContext()
+
     print_phase_header(1, "Find Initial Feasible Solution")
     
-    aux_graph = helper.create_auxiliary_graph(original_graph)
-    initial_basis, initial_flows = helper.create_initial_basis(original_graph)
+    # One fused pass builds the auxiliary graph and the starting basis
+    aux_graph, initial_basis, initial_flows = helper.build_phase1_artifacts(original_graph)
     
     aux_controller = run_phase(
         aux_graph,
         PrebuiltInitializer(initial_basis, initial_flows),
-        "Phase 1"
+        "Phase 1",
+        layout=layout,
+        batch=batch
     )
     
     if not aux_controller.is_solved():
@@ -97,20 +128,24 @@ def main() -> None:
     phase2_controller = run_phase(
         original_graph,
         PrebuiltInitializer(phase2_result.basis_edges, phase2_result.flows),
-        "Phase 2"
+        "Phase 2",
+        layout=layout,
+        batch=batch
     )
     
     if phase2_controller.is_solved():
         final_state = phase2_controller.get_current_state()
         
-        print("\n" + "=" * 70)
-        print("SOLUTION SUMMARY")
-        print("=" * 70)
-        print(f"Phase 1 iterations:  {final_aux_state.iteration + 1}")
-        print(f"Phase 2 iterations:  {final_state.iteration + 1}")
-        print(f"Total iterations:    {final_aux_state.iteration + final_state.iteration + 2}")
-        print(f"\nOptimal cost:        {final_state.objective_value:.2f}")
-        print("=" * 70 + "\n")
+        sys.stdout.write(
+            f"\n{'=' * 70}\n"
+            "SOLUTION SUMMARY\n"
+            f"{'=' * 70}\n"
+            f"Phase 1 iterations:  {final_aux_state.iteration + 1}\n"
+            f"Phase 2 iterations:  {final_state.iteration + 1}\n"
+            f"Total iterations:    {final_aux_state.iteration + final_state.iteration + 2}\n"
+            f"\nOptimal cost:        {final_state.objective_value:.2f}\n"
+            f"{'=' * 70}\n\n"
+        )
 
 
 if __name__ == "__main__":
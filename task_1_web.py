@@ -8,6 +8,10 @@ matplotlib.rcParams['webagg.address'] = '0.0.0.0'
 matplotlib.rcParams['figure.dpi'] = 80
 matplotlib.rcParams['savefig.dpi'] = 100
 
+# Chunk long paths in the Agg rasterizer so edge polylines stay off the
+# slow single-path code path when rendering frames for the browser
+matplotlib.rcParams['agg.path.chunksize'] = 10000
+
 from network_transport import Graph, run_interactive_demo
 
 def create_railway_network() -> Graph:
@@ -5,41 +5,17 @@ from network_transport.utils import run_interactive_demo
 def create_capacitated_network() -> Graph:
     graph = Graph()
     
-    nodes_config = [
-        ("1", +40, "Source"),
-        ("2", +67, "Source"),
-        ("3", -50, "Sink"),
-        ("4", -60, "Sink"),
-        ("5", -20, "Sink"),
-        ("6", +23, "Source"),
-        ("7", 0, "Transit"),
-        ("8", 0, "Transit"),
-    ]
-    
-    for node_id, balance, _ in nodes_config:
-        graph.add_node(node_id, balance=balance)
-    
-    edges_config = [
-        ("1", "2", 4, 35),
-        ("1", "5", 6, 50),
-        ("2", "3", 9, 45),
-        ("2", "7", 8, 40),
-        ("3", "4", 7, 45),
-        ("4", "6", 5, 20),
-        ("5", "6", 6, 20),
-        ("5", "8", 11, 20),
-        ("6", "8", 12, 41),
-        ("7", "1", 15, 10),
-        ("7", "3", 3, 40),
-        ("7", "5", 7, 15),
-        ("8", "3", 8, 15),
-        ("8", "4", 16, 20),
-        ("8", "7", 19, 10),
-    ]
-    
-    for from_node, to_node, cost, capacity in edges_config:
-        graph.add_edge(from_node, to_node, cost=cost, capacity=capacity)
-    
+    # Structure-of-arrays: parallel sequences fed to the bulk APIs
+    node_ids = ["1", "2", "3", "4", "5", "6", "7", "8"]
+    balances = [+40, +67, -50, -60, -20, +23, 0, 0]
+    graph.add_nodes_bulk(node_ids, balances)
+
+    edge_from  = ["1", "1", "2", "2", "3", "4", "5", "5", "6", "7", "7", "7", "8", "8", "8"]
+    edge_to    = ["2", "5", "3", "7", "4", "6", "6", "8", "8", "1", "3", "5", "3", "4", "7"]
+    costs      = [4, 6, 9, 8, 7, 5, 6, 11, 12, 15, 3, 7, 8, 16, 19]
+    capacities = [35, 50, 45, 40, 45, 20, 20, 20, 41, 10, 40, 15, 15, 20, 10]
+    graph.add_edges_bulk(edge_from, edge_to, costs, capacities)
+
     return graph
 
 
@@ -51,10 +27,13 @@ def print_network_info(graph: Graph) -> None:
     print()
     
     print("Edges (with capacity constraints):")
-    for edge in graph.edges.values():
-        capacity_str = f"{edge.capacity:.0f}" if edge.capacity != float('inf') else "∞"
+    # Branch-free per partition: the capacity test is decided once
+    for edge in graph.capacitated_edges:
+        print(f"  {edge.from_node} → {edge.to_node}: "
+              f"cost={edge.cost:.0f}, capacity={edge.capacity:.0f}")
+    for edge in graph.uncapacitated_edges:
         print(f"  {edge.from_node} → {edge.to_node}: "
-              f"cost={edge.cost:.0f}, capacity={capacity_str}")
+              f"cost={edge.cost:.0f}, capacity=∞")
     print()
 
 
@@ -1,6 +1,12 @@
+import os
+import sys
+
 from network_transport import Graph, TransportSolver, SolverController
-from network_transport.solver.strategies import PhaseOneInitializer, InitializationStrategy
-from network_transport.solver.strategies.initialization import PrebuiltInitializer
+from network_transport.solver.strategies import InitializationStrategy
+from network_transport.solver.strategies.initialization import (
+    DEFAULT_PHASE_ONE_INITIALIZER,
+    PrebuiltInitializer,
+)
 from network_transport.ui import InteractiveSession, LayoutContext
 from network_transport.solver.utils import BasisResult, SolutionState
 from typing import Set, Tuple, Dict
@@ -8,49 +14,31 @@ from typing import Set, Tuple, Dict
 
 def create_railway_network() -> Graph:
     graph = Graph()
-    
-    nodes_config = [
-        ("1", +40, "Source"),
-        ("2", +67, "Source"),
-        ("3", -50, "Sink"),
-        ("4", -60, "Sink"),
-        ("5", -20, "Sink"),
-        ("6", +23, "Source"),
-        ("7", 0, "Transit"),
-        ("8", 0, "Transit"),
-    ]
-    
-    for node_id, balance, _ in nodes_config:
-        graph.add_node(node_id, balance=balance)
-    
-    edges_config = [
-        ("1", "2", 4, 35),
-        ("1", "5", 6, 50),
-        ("2", "3", 9, 45),
-        ("2", "7", 8, 40),
-        ("3", "4", 7, 45),
-        ("4", "6", 5, 20),
-        ("5", "6", 6, 20),
-        ("5", "8", 11, 20),
-        ("6", "8", 12, 41),
-        ("7", "1", 15, 10),
-        ("7", "3", 3, 40),
-        ("7", "5", 7, 15),
-        ("8", "3", 8, 15),
-        ("8", "4", 16, 20),
-        ("8", "7", 19, 10),
-    ]
-    
-    for from_node, to_node, cost, capacity in edges_config:
-        graph.add_edge(from_node, to_node, cost=cost, capacity=capacity)
-    
+
+    # Structure-of-arrays: parallel sequences fed to the bulk APIs
+    node_ids = ["1", "2", "3", "4", "5", "6", "7", "8"]
+    balances = [+40, +67, -50, -60, -20, +23, 0, 0]
+    graph.add_nodes_bulk(node_ids, balances)
+
+    edge_from  = ["1", "1", "2", "2", "3", "4", "5", "5", "6", "7", "7", "7", "8", "8", "8"]
+    edge_to    = ["2", "5", "3", "7", "4", "6", "6", "8", "8", "1", "3", "5", "3", "4", "7"]
+    costs      = [4, 6, 9, 8, 7, 5, 6, 11, 12, 15, 3, 7, 8, 16, 19]
+    capacities = [35, 50, 45, 40, 45, 20, 20, 20, 41, 10, 40, 15, 15, 20, 10]
+    graph.add_edges_bulk(edge_from, edge_to, costs, capacities)
+
+    # Prime the CSR view so array-level consumers (phase construction,
+    # reductions) share one build instead of each mapping ids themselves
+    graph.csr()
+
     return graph
 
 
 class PhaseOneHelper:
-    
+
+    __slots__ = ('initializer',)
+
     def __init__(self):
-        self.initializer = PhaseOneInitializer()
+        self.initializer = DEFAULT_PHASE_ONE_INITIALIZER
     
     def create_auxiliary_graph(self, graph: Graph) -> Graph:
         return self.initializer._create_auxiliary_graph(graph) # pyright: ignore[reportPrivateUsage]
@@ -58,32 +46,46 @@ class PhaseOneHelper:
     def create_initial_basis(self, graph: Graph) -> Tuple[Set[Tuple[str, str]], Dict[Tuple[str, str], float]]:
         return self.initializer._setup_initial_state(graph) # pyright: ignore[reportPrivateUsage]
     
+    def build_phase1_artifacts(self, graph: Graph) -> Tuple[Graph, Set[Tuple[str, str]], Dict[Tuple[str, str], float]]:
+        return self.initializer.build_phase1_artifacts(graph)
+
     def extract_basis_for_phase2(self, original_graph: Graph, aux_final_state: SolutionState) -> BasisResult:
         return self.initializer._extract_original_solution(original_graph, aux_final_state) # pyright: ignore[reportPrivateUsage]
 
 def print_phase_header(phase_num: int, title: str) -> None:
-    print("\n" + "=" * 70)
-    print(f"PHASE {phase_num}: {title}")
-    print("=" * 70)
+    # One buffered write instead of three line-buffered print calls
+    sys.stdout.write(f"\n{'=' * 70}\nPHASE {phase_num}: {title}\n{'=' * 70}\n")
 
 
 def run_phase(
-    graph: Graph, 
+    graph: Graph,
     initialization_strategy: InitializationStrategy,
-    phase_name: str
+    phase_name: str,
+    batch: bool = False
 ) -> SolverController:
     solver = TransportSolver(graph=graph, initialization_strategy=initialization_strategy)
     controller = SolverController(graph, solver=solver)
+
+    print(f"\nStarting {phase_name}...")
+
+    if batch:
+        # Headless: run the solver to optimality without any UI session
+        controller.solve_all()
+        return controller
+
     layout = LayoutContext()
     session = InteractiveSession(graph, layout, controller)
-    
-    print(f"\nStarting {phase_name}...")
 
     session.setup_and_run()
     return controller
 
 
 def main() -> None:
+    # Benchmark/CI runs skip the interactive UI entirely; piped or
+    # redirected stdout means nobody is there to click, so default to the
+    # headless path there too (TRANSIT_BATCH still forces it explicitly)
+    batch = bool(os.environ.get("TRANSIT_BATCH")) or not sys.stdout.isatty()
+
     print("\n" + "=" * 70)
     print("Two-Phase - Railway Transportation Problem")
     print("=" * 70)
@@ -93,13 +95,14 @@ def main() -> None:
     
     print_phase_header(1, "Find Initial Feasible Solution")
     
-    aux_graph = helper.create_auxiliary_graph(original_graph)
-    initial_basis, initial_flows = helper.create_initial_basis(original_graph)
+    # One fused pass builds the auxiliary graph and the starting basis
+    aux_graph, initial_basis, initial_flows = helper.build_phase1_artifacts(original_graph)
     
     aux_controller = run_phase(
         aux_graph,
         PrebuiltInitializer(initial_basis, initial_flows),
-        "Phase 1"
+        "Phase 1",
+        batch=batch
     )
     
     if not aux_controller.is_solved():
@@ -115,20 +118,23 @@ def main() -> None:
     phase2_controller = run_phase(
         original_graph,
         PrebuiltInitializer(phase2_result.basis_edges, phase2_result.flows),
-        "Phase 2"
+        "Phase 2",
+        batch=batch
     )
     
     if phase2_controller.is_solved():
         final_state = phase2_controller.get_current_state()
         
-        print("\n" + "=" * 70)
-        print("SOLUTION SUMMARY")
-        print("=" * 70)
-        print(f"Phase 1 iterations:  {final_aux_state.iteration + 1}")
-        print(f"Phase 2 iterations:  {final_state.iteration + 1}")
-        print(f"Total iterations:    {final_aux_state.iteration + final_state.iteration + 2}")
-        print(f"\nOptimal cost:        {final_state.objective_value:.2f}")
-        print("=" * 70 + "\n")
+        sys.stdout.write(
+            f"\n{'=' * 70}\n"
+            "SOLUTION SUMMARY\n"
+            f"{'=' * 70}\n"
+            f"Phase 1 iterations:  {final_aux_state.iteration + 1}\n"
+            f"Phase 2 iterations:  {final_state.iteration + 1}\n"
+            f"Total iterations:    {final_aux_state.iteration + final_state.iteration + 2}\n"
+            f"\nOptimal cost:        {final_state.objective_value:.2f}\n"
+            f"{'=' * 70}\n\n"
+        )
 
 
 if __name__ == "__main__":